@@ -4,55 +4,322 @@ NetLink - Network File Transfer Application
 Cross-platform graphical interface for file transfers
 """
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import font as tkfont
+import atexit
+import concurrent.futures
+import functools
 import threading
 import socket
 import os
+import random
 import time
-import webbrowser
 import sys
 import json
-import subprocess
 import shutil
-import zipfile
+import stat
+from collections import deque
 from pathlib import Path
 from transfer_server import TransferServer
 from transfer_client import TransferClient
 from service_discovery import ServiceDiscovery
+import zip_writer
 
 # Application version
 VERSION = "0.1.4"
 
-# Optional drag-and-drop support via tkinterdnd2. If unavailable,
-# the UI will continue to work without DnD.
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
+# Directory this module lives in, resolved once at import (the About-tab
+# doc opener and config/history paths all live next to the script)
+_BASE_DIR = Path(__file__).resolve().parent
 
-    TKDND_AVAILABLE = True
-except Exception:
-    DND_FILES = None
-    TkinterDnD = None
-    TKDND_AVAILABLE = False
+# Reciprocal of one MiB: multiply instead of dividing per history entry
+_MB_INV = 1.0 / (1024 * 1024)
+
+# Units for the size/speed formatters; the bucket index comes from
+# bit_length (one int op) instead of a divide-and-compare loop
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SPEED_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
+
+
+# Cached formatter cores, keyed on whole-unit ints. Progress callbacks
+# hit these thousands of times per transfer with heavily repeated values
+# (totals, quantized speeds, ETA seconds), so repeats cost a dict lookup
+# instead of float division and f-string work.
+@functools.lru_cache(maxsize=4096)
+def _format_size_cached(n):
+    i = min(len(_SIZE_UNITS) - 1, (n.bit_length() - 1) // 10) if n > 0 else 0
+    return f"{n / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_speed_cached(n):
+    if n <= 0:
+        return "-"
+    i = min(len(_SPEED_UNITS) - 1, (n.bit_length() - 1) // 10)
+    return f"{n / (1 << (10 * i)):.2f} {_SPEED_UNITS[i]}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_eta_cached(s):
+    if s < 60:
+        return f"{s}s"
+    return f"{s // 60}m {s % 60}s"
+
+
+def _quantize(n):
+    """Keep the top 8 bits of n (error < 0.4%, invisible at 2 decimals).
+
+    Collapses near-identical speeds onto shared cache keys so the
+    lru_cache above actually hits instead of churning.
+    """
+    shift = n.bit_length() - 8
+    return n >> shift << shift if shift > 0 else n
+
+# Pre-bound for the MAGI data getters: one C-level call, no attribute
+# lookup on the module per invocation
+_randint = random.randint
+
+# Maximum lines kept in the on-screen transfer logs. Tk Text widgets slow
+# down as content grows, so old lines are trimmed ring-buffer style once a
+# log exceeds this. Lower it on low-end machines if redraws feel sluggish.
+_LOG_MAX_LINES = 2000
+
+# Multi-file ZIP jobs up to this total input size are compressed across
+# worker processes; the per-member compressed blobs live in memory until
+# written, so the cap bounds peak usage
+_PARALLEL_ZIP_MAX_BYTES = 256 * 1024 * 1024
+
+# About-tab body texts (static, module-level so tab builds reuse them);
+# the technical block is a template filled per build
+_FEATURES_TEXT = """
+• Cross-platform compatibility (Windows, macOS, Linux)
+• No external dependencies - Pure Python
+• Automatic network discovery
+• Secure local file transfers
+• Real-time progress monitoring
+• User-friendly graphical interface
+• Support for large file transfers
+• Easy to use and setup
+• No installation required
+• Open source project
+• Regular updates and improvements
+• Community driven development
+"""
+
+_AUTHOR_TEXT = """
+Developed by: Scorpionziky
 
-# Optional system tray support using pystray + Pillow. If unavailable, feature is disabled.
+This application was created to provide a simple, reliable 
+file transfer solution for local networks without requiring 
+any additional software installations.
+
+The project aims to make file sharing between computers on 
+the same network as easy as possible, while maintaining 
+security and performance.
+
+If you encounter any issues or have suggestions for 
+improvements, please don't hesitate to contact me using 
+the methods below.
+"""
+
+_INFO_TEXT = """
+This application is built using Python's standard library only, 
+making it lightweight and portable. It uses TCP sockets for 
+reliable file transfers and UDP multicast for service discovery.
+
+The application is designed for use on trusted local networks 
+only. For security reasons, it does not include encryption or 
+authentication features.
+
+If you enjoy using this application, consider starring the 
+project on GitHub or contributing to its development!
+"""
+
+_TECH_TEMPLATE = """
+Python Version: {py}
+Platform: {plat}
+Hostname: {host}
+Local IP: {ip}
+Application Directory: {appdir}
+"""
+
+# Peer-age status buckets indexed by (age>=5)+(age>=30): turns the
+# per-peer branch ladder into one arithmetic step and a tuple index
+_AGE_BUCKETS = (
+    ("#2ecc71", "\U0001F7E2"),  # green: seen within 5s
+    ("#f1c40f", "\U0001F7E1"),  # yellow: seen within 30s
+    ("#95a5a6", "\u26AA"),      # gray: stale
+)
+
+
+def _color_for_age(age):
+    """Return (color, status icon) for a peer age in seconds."""
+    return _AGE_BUCKETS[(age >= 5) + (age >= 30)]
+
+
+# MAGI boot sequence template, composed once at import. Static lines are
+# stored ready to write; (None, tag, (label, key)) entries are formatted
+# per run from a snapshot of the dynamic getters (see
+# _start_magi_boot_sequence), so only the ~12 live fields allocate.
+_MAGI_BOOT_TEMPLATE = (
+    ("", "system", None),
+    ("[MAGI SYSTEM BOOT v1.0]", "header", None),
+    (">>> INITIALIZING MODULES", "status", None),
+    ("   Melchior ............. OK", "success", None),
+    ("   Balthasar ............ OK", "success", None),
+    ("   Casper ............... OK", "success", None),
+    (">>> SYNCHRONIZATION .... COMPLETE", "status", None),
+    (">>> TRINARY DECISION ENGINE ONLINE", "status", None),
+    ("", "system", None),
+    ("[CONNECTION STATUS]", "header", None),
+    (None, "system", ("CONNECTION", "connection")),
+    (None, "system", ("LATENCY", "latency")),
+    (None, "system", ("PACKET LOSS", "packet_loss")),
+    (None, "system", ("BANDWIDTH", "bandwidth")),
+    ("", "system", None),
+    ("[TRANSFER MODULE]", "header", None),
+    (None, "system", ("TRANSFER SPEED", "transfer_speed")),
+    (None, "system", ("FILES SENT", "files_sent")),
+    (None, "system", ("FILES PENDING", "files_pending")),
+    ("", "system", None),
+    ("[DEVICE STATUS]", "header", None),
+    (None, "system", ("CPU LOAD", "cpu_load")),
+    (None, "system", ("MEMORY USAGE", "memory_usage")),
+    (None, "system", ("DEVICE STATUS", "device_status")),
+    ("", "system", None),
+    ("[SECURITY CHECK]", "header", None),
+    (None, "system", ("AUTH STATUS", "auth_status")),
+    (None, "system", ("ENCRYPTION", "encryption")),
+    ("", "system", None),
+    (">>> MAGI SYSTEM READY", "status", None),
+)
+
+# Quick Guide texts (module-level so they are built once, not per open)
+_QUICK_GUIDE_IT = (
+    "Breve guida al programma\n"
+    "-----------------------\n\n"
+    "Come funziona (sintesi):\n"
+    "- Questo programma usa UDP (multicast/broadcast) per scoprire altri computer in rete.\n"
+    "- Usa TCP per il trasferimento affidabile dei file.\n"
+    "- Puoi avviare il ricevitore (Start Receiver) su una macchina e inviare file da un'altra.\n\n"
+    "Passi rapidi per inviare/ricevere file:\n"
+    "1) Su chi riceve: apri la tab 'Receive Files' -> imposta la cartella e clicca 'Start Receiver'.\n"
+    "2) Su chi invia: seleziona il destinatario dalla lista 'Discovered Machines' o usa 'Manual Connection...'.\n"
+    "3) Aggiungi File o Cartelle nella tab 'Send Files' e premi 'Send'.\n\n"
+    "Problemi comuni e risoluzioni rapide:\n"
+    "- Non vedo altri computer nella lista: controlla che tutte le macchine siano nella stessa rete e che il firewall non blocchi UDP 5007. Usa 'Discovery Diagnostics' per verificare.\n"
+    "- Il file non arriva: assicurati che il ricevitore abbia premuto 'Start Receiver' e che la porta mostrata sia raggiungibile (default 5000). Prova la 'Manual Connection' inserendo l'IP del ricevente.\n"
+    "- Ricevo l'avviso 'No incoming connections': il programma mostra un indicatore arancione se il server ascolta ma non riceve connessioni; spesso è un firewall o la porta non è inoltrata. Apri le impostazioni di rete o disattiva temporaneamente il firewall per test.\n\n"
+    "Suggerimenti avanzati:\n"
+    "- Se la scoperta non funziona, usa sempre 'Manual Connection' con IP e porta.\n"
+    "- Per trasferimenti multipli grandi, verifica spazio su disco nella cartella di destinazione.\n"
+    "- Usa i log nelle tabs 'Transfer Log' e 'Receiver Log' per vedere messaggi di errore e diagnostica.\n\n"
+    "Se hai bisogno di aiuto avanzato, invia i messaggi dei log (dal menu) o apri un issue su GitHub con dettagli di rete e gli output della 'Discovery Diagnostics'.\n"
+)
+
+_QUICK_GUIDE_EN = (
+    "Quick Guide\n"
+    "-----------------------\n\n"
+    "How it works (summary):\n"
+    "- This app uses UDP (multicast/broadcast) to discover other computers on the local network.\n"
+    "- It uses TCP for reliable file transfers.\n"
+    "- Start the receiver on one machine and send files from another.\n\n"
+    "Quick steps to send/receive files:\n"
+    "1) On the receiver: open 'Receive Files' -> set the folder and click 'Start Receiver'.\n"
+    "2) On the sender: select the receiver from 'Discovered Machines' or use 'Manual Connection...'.\n"
+    "3) Add Files or Folders in the 'Send Files' tab and click 'Send'.\n\n"
+    "Common problems and quick fixes:\n"
+    "- No machines in the list: ensure all computers are on the same network and that UDP port 5007 is not blocked by firewall. Use 'Discovery Diagnostics' to check.\n"
+    "- File doesn't arrive: ensure the receiver pressed 'Start Receiver' and the port (default 5000) is reachable. Try 'Manual Connection' with the receiver IP.\n"
+    "- 'No incoming connections' warning: the app shows an orange indicator if the server listens but receives no connections; this often indicates a firewall or network configuration blocking the port. Check firewall settings or allow the app through the firewall for testing.\n\n"
+    "Advanced tips:\n"
+    "- If discovery fails, always try 'Manual Connection' with IP and port.\n"
+    "- For large transfers, verify available disk space on the destination folder.\n"
+    "- Check 'Transfer Log' and 'Receiver Log' for detailed messages and errors.\n\n"
+    "If you need more help, collect the logs and diagnostics output and open an issue on GitHub including network details and the diagnostics output.\n"
+)
+
+# JSON codec for config/history: prefer orjson when installed (several
+# times faster and emits bytes directly, skipping a unicode round-trip);
+# fall back to the stdlib so the app still runs with no external
+# dependencies.
 try:
-    import pystray
-    from PIL import Image, ImageDraw
+    import orjson
+
+    _json_loads = orjson.loads
 
-    TRAY_AVAILABLE = True
+    def _json_dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
 except Exception:
-    pystray = None
-    Image = None
-    ImageDraw = None
-    TRAY_AVAILABLE = False
-try:
-    # Optional ImageTk for converting PIL images to Tk PhotoImage
-    from PIL import ImageTk
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
 
-    PIL_IMAGETK = True
+# Optional archive compressor: zstandard spreads compression across all
+# cores internally and is several times faster than DEFLATE at similar
+# ratios. When missing, the ZIP path below is used — the receiver treats
+# either archive as an opaque file, so nothing changes on the wire.
+try:
+    import zstandard as _zstd
 except Exception:
-    ImageTk = None
-    PIL_IMAGETK = False
+    _zstd = None
+
+# Optional dependencies (tkinterdnd2, pystray, Pillow) are probed lazily
+# on first use instead of at module import: their import work no longer
+# sits on the path to the first UI paint, and each probe result is cached
+# so the cost is paid at most once per session. If a package is
+# unavailable, the corresponding feature is simply disabled.
+
+@functools.lru_cache(maxsize=None)
+def _require_dnd():
+    """Return (DND_FILES, TkinterDnD) from tkinterdnd2, or (None, None)."""
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
+        return DND_FILES, TkinterDnD
+    except Exception:
+        return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def _require_tray():
+    """Return the pystray module, or None when unavailable."""
+    try:
+        import pystray
+        return pystray
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _build_tray_image(size, color):
+    """Rasterize the circular tray icon once per (size, color)."""
+    Image, ImageDraw, _ = _require_pil()
+    if Image is None or ImageDraw is None:
+        return None
+    try:
+        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        # draw a filled circle
+        margin = int(size * 0.12)
+        draw.ellipse((margin, margin, size - margin, size - margin), fill=color)
+        return img
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _require_pil():
+    """Return (Image, ImageDraw, ImageTk); entries are None when missing."""
+    try:
+        from PIL import Image, ImageDraw
+    except Exception:
+        Image = ImageDraw = None
+    try:
+        from PIL import ImageTk
+    except Exception:
+        ImageTk = None
+    return Image, ImageDraw, ImageTk
 
 
 class FileTransferGUI:
@@ -67,6 +334,24 @@ class FileTransferGUI:
         self.default_font = ("Segoe UI", 10)
         self.title_font = ("Segoe UI", 11, "bold")
 
+        # Named fonts shared across tabs: Tk resolves these by name in
+        # O(1) and shares metrics, instead of parsing a font tuple per
+        # widget creation
+        try:
+            tkfont.Font(root=self.root, name="AppSmall", family="Arial", size=9)
+            tkfont.Font(root=self.root, name="AppTiny", family="Arial", size=8)
+            tkfont.Font(root=self.root, name="AppMono", family="Courier", size=8)
+        except Exception:
+            pass
+
+        # Hostname is stable for the process lifetime; cache it so tab
+        # builds and discovery restarts skip the syscall
+        self._hostname = socket.gethostname()
+
+        # Application directory (resolved once at import); config, log and
+        # history paths below all derive from it.
+        self._base_dir = _BASE_DIR
+
         # Server thread reference/state
         self.server_thread = None
         self.server_running = False
@@ -74,6 +359,19 @@ class FileTransferGUI:
         # Single service discovery instance for this machine
         self.discovery = None
         self._discovery_empty_logged = False
+        # Guard so the health check doesn't fire concurrent restarts
+        self._restart_in_progress = False
+        # Cached Quick Guide windows keyed by language ('it'/'en')
+        self._quick_guide_wins = {}
+        # Single-worker executor for small background disk writes (config);
+        # one worker keeps the writes ordered
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Local IP resolved once up front and cached for the session, so
+        # tab construction reads an attribute instead of opening a UDP
+        # socket per call (the connect trick has a short timeout but still
+        # hits the network stack). Help > Refresh Local IP re-resolves.
+        self._local_ip_cache = None
+        self._get_local_ip()  # warms the cache
         # Track last incoming connection time (for monitoring firewall/connectivity issues)
         self.last_connection_time = None
         # Flag to avoid repeating the same warning
@@ -90,13 +388,16 @@ class FileTransferGUI:
 
         # Selected files to send
         self.selected_files = []
+        # path -> listbox display string, filled on first sight so list
+        # rebuilds never re-stat files already shown
+        self._file_display_cache = {}
 
         # Config file path (stored next to this script or in per-user folder)
         try:
             # If running as a frozen bundle (PyInstaller), avoid writing next to the
             # executable's temporary extract folder; use AppData/home instead.
             is_frozen = getattr(sys, 'frozen', False)
-            candidate = Path(__file__).parent / "ft_gui_config.json"
+            candidate = self._base_dir / "ft_gui_config.json"
             use_candidate = False
 
             try:
@@ -146,16 +447,25 @@ class FileTransferGUI:
             self._config_path = Path("ft_gui_config.json")
 
         # Logging file path
+        self._log_file_path = self._base_dir / "ft_gui_logs.txt"
+        # Open the log file once (raw fd, append mode) and keep it for the
+        # whole session. Log lines are queued pre-encoded in memory (any
+        # thread may append) and the 250ms _flush_log ticker drains them
+        # with a single os.write, so a burst of progress lines costs one
+        # syscall with no TextIOWrapper locking or re-encoding per flush.
+        self._log_buf = []
+        self._log_buf_lock = threading.Lock()
         try:
-            self._log_file_path = Path(__file__).parent / "ft_gui_logs.txt"
-        except Exception:
-            self._log_file_path = Path("ft_gui_logs.txt")
-        # Initialize log file
-        try:
-            with open(self._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n=== Session started {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            self._log_fd = os.open(
+                self._log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            os.write(
+                self._log_fd,
+                f"\n=== Session started {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n".encode('utf-8'),
+            )
+            atexit.register(self._close_log)
         except Exception:
-            pass
+            self._log_fd = None
 
         # Load saved preferences (if any)
         try:
@@ -163,9 +473,20 @@ class FileTransferGUI:
         except Exception:
             pass
 
+        # Socket buffer preference in KB (SO_RCVBUF/SO_SNDBUF for the
+        # transfer sockets); 0 keeps the OS default. Applied on server start.
+        self.socket_buffer_kb = 0
+
+        # DEFLATE level for compress-before-send ZIPs. 1 is near line
+        # rate on a LAN with only a small ratio penalty vs the zlib
+        # default of 6; raise it for slow links.
+        self.compress_level = 1
+
         # Initialize preference variables BEFORE creating menu (menu uses these)
         # Notification preference (beep on new file received)
         self.notify_on_receive = True
+        # Throttle state for the receive bell (monotonic seconds)
+        self._last_bell_time = 0.0
         # BooleanVar for menu checkbutton (persisted UI state)
         try:
             self.notify_on_receive_var = tk.BooleanVar(value=self.notify_on_receive)
@@ -183,20 +504,75 @@ class FileTransferGUI:
         except Exception:
             self.compress_before_send_var = None
 
+        # Keep the attributes in sync with the checkbutton vars and
+        # auto-persist preference changes
+        for var in (self.notify_on_receive_var, self.compress_before_send_var):
+            if var is not None:
+                try:
+                    var.trace_add('write', self._on_pref_var_changed)
+                except Exception:
+                    pass
+
         # Transfer control: pause/resume state
         self.transfer_paused = False
         self._pause_event = threading.Event()
         self._pause_event.set()  # Initially not paused
         self._cancel_transfer = False  # Flag to cancel ongoing transfer
 
+        # Coalesced progress updates from transfer threads. Workers call
+        # _ui_set(name, value); the latest value per widget is applied in a
+        # single 100ms tick instead of one `after` per chunk (see _flush_ui).
+        self._pending_ui = {}
+        self._pending_ui_lock = threading.Lock()
+        self._ui_flush_scheduled = False
+
+        # Shared tooltip: one hidden Toplevel + Label reused for every
+        # registered widget (see _create_tooltip), created on first hover
+        self._tooltip_text = {}
+        self._tooltip_win = None
+        self._tooltip_label = None
+
         # Transfer history (for display in Advanced menu)
-        try:
-            self._history_path = Path(__file__).parent / "ft_transfer_history.json"
-        except Exception:
-            self._history_path = Path("ft_transfer_history.json")
-        self.transfer_history = []  # List of {'type': 'send'|'recv', 'filename', 'size', 'timestamp', 'duration_sec'}
+        # History lives in an append-only JSONL file (one entry per line) so
+        # recording a transfer is O(1) instead of rewriting the whole file;
+        # in memory we keep a bounded ring of the most recent entries.
+        self._history_path = self._base_dir / "ft_transfer_history.jsonl"
+        self._legacy_history_path = self._base_dir / "ft_transfer_history.json"
+        self.transfer_history = deque(maxlen=100)  # {'type': 'send'|'recv', 'filename', 'size_bytes', 'timestamp', 'duration_sec', 'speed_mbps'}
+        # Entries recorded but not yet appended to disk (debounced writer)
+        self._history_pending = []
+        self._history_flush_pending = False
         self._load_transfer_history()
 
+        # Raw (timestamp, message) log entries mirroring the on-screen logs.
+        # Bounded like the widgets themselves; filters can re-render from
+        # these instead of scanning the Text widget.
+        # Entries are bucketed by level at append time so switching the
+        # filter combobox is a bulk re-insert of one bucket instead of a
+        # scan of the whole Text widget
+        self._log_buckets = {
+            side: {
+                lvl: deque(maxlen=_LOG_MAX_LINES)
+                for lvl in ("All", "INFO", "WARNING", "ERROR")
+            }
+            for side in ("send", "recv")
+        }
+        # Log widgets with a see(END) already queued (see _append_log)
+        self._autoscroll_pending = set()
+        # after() handle for a scheduled machines-list refresh; a new
+        # scan cancels the previous one instead of stacking rebuilds
+        self._pending_machine_update = None
+        # Trailing-edge throttle state for _update_machines_list_throttled
+        self._last_list_update = 0.0
+        self._list_pending = False
+        # Lines awaiting insertion into the Text widgets; drained in one
+        # insert per widget by the 100ms _drain_log_widgets ticker
+        self._send_log_pending = []
+        self._recv_log_pending = []
+        # (epoch_second, local_str, iso_str): timestamps only change once
+        # a second, so log bursts reuse the formatted strings
+        self._ts_cache = (0, "", "")
+
         # Create notebook (tabs)
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill="both", expand=True, padx=12, pady=12)
@@ -213,8 +589,11 @@ class FileTransferGUI:
 
         self._create_send_tab()
         self._create_receive_tab()
-        self._create_magi_tab()
-        self._create_about_tab()
+        # About and MAGI widget trees are expensive (canvas, dozens of
+        # labels); build them on first visit instead of at startup
+        self._about_built = False
+        self._magi_built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Update compression status indicator
         status = "On" if self.compress_before_send else "Off"
@@ -235,7 +614,7 @@ class FileTransferGUI:
 
         # Initialize tray icon if available
         try:
-            if TRAY_AVAILABLE:
+            if _require_tray():
                 self._init_tray()
         except Exception:
             pass
@@ -248,15 +627,22 @@ class FileTransferGUI:
         self._status_images = {}
         # Keep references to images used by Treeview items to avoid GC
         self._item_images = {}
+        # Incremental machines-list state: peer name -> Treeview iid and
+        # the (text, image) last applied, so updates only touch changed rows
+        self._tree_items = {}
+        self._tree_state = {}
 
         # Health check: monitor for blocked/stuck threads after standby
         self._health_check_counter = 0
         self._last_poll_time = time.time()
 
-        # UI timeout watchdog: detect frozen GUI and refresh/recover
-        self._ui_last_response_time = time.time()
-        self._ui_timeout_threshold = 5  # seconds; if no response in 5s, consider frozen
-        self._ui_frozen_recovered = False  # flag to prevent repeated recovery attempts
+        # UI liveness probe: the Tk main loop posts an ack every 500ms and a
+        # daemon thread verifies the acks keep coming. Unlike the old
+        # after()-based watchdog (which, being a Tk callback itself, could
+        # only observe freezes after they resolved), this detects a freeze
+        # while it is happening.
+        self._ui_liveness = threading.Event()
+        self._ui_timeout_threshold = 5  # seconds without an ack => frozen
 
         # Start discovery after UI is ready
         self.root.after(1000, self.start_discovery_service)
@@ -267,8 +653,27 @@ class FileTransferGUI:
         # Start health check monitor (every 30 seconds)
         self._schedule_health_check()
 
-        # Start UI watchdog (every 2 seconds) to detect frozen GUI
-        self._schedule_ui_watchdog()
+        # Start UI liveness probe: main-loop ack + daemon-thread monitor
+        self.root.after(500, self._ack_liveness)
+        threading.Thread(target=self._ui_liveness_monitor, daemon=True).start()
+
+        # Periodically flush the buffered log file handle (every 1 second)
+        self.root.after(1000, self._flush_log)
+        self.root.after(100, self._drain_log_widgets)
+
+        # Prewarm the lazily-imported action modules off the UI thread:
+        # keeps them out of the first-paint path while avoiding a visible
+        # stall on the first export/open-folder click (sys.modules caches
+        # them after this)
+        threading.Thread(
+            target=lambda: (
+                __import__('csv'),
+                __import__('subprocess'),
+                __import__('webbrowser'),
+                __import__('zipfile'),
+            ),
+            daemon=True,
+        ).start()
 
         # Easter-egg: beta badge click counter and NERV mode state
         self._beta_click_count = 0
@@ -290,7 +695,7 @@ class FileTransferGUI:
                 # Update list if peers changed
                 if current_peers != self.last_peers:
                     self.last_peers = current_peers
-                    self._update_machines_list()
+                    self._update_machines_list_throttled()
             # Mark that poll succeeded
             self._last_poll_time = time.time()
         except Exception:
@@ -309,15 +714,121 @@ class FileTransferGUI:
         # Schedule next health check (every 30 seconds)
         self.root.after(30000, self._schedule_health_check)
 
-    def _schedule_ui_watchdog(self):
-        """Schedule periodic UI responsiveness checks."""
+    def _ui_set(self, name, value):
+        """Queue a progress-widget update from a worker thread.
+
+        `name` is the attribute name of a StringVar (or Progressbar) on
+        self; only the latest value per name survives until the next
+        _flush_ui tick, so per-chunk callbacks cost a dict store instead
+        of a Tk round-trip each.
+        """
+        with self._pending_ui_lock:
+            self._pending_ui[name] = value
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
         try:
-            self._ui_watchdog()
+            self.root.after(100, self._flush_ui)
+        except Exception:
+            with self._pending_ui_lock:
+                self._ui_flush_scheduled = False
+
+    def _flush_ui(self):
+        """Apply queued progress updates on the UI thread (one per widget)."""
+        with self._pending_ui_lock:
+            pending = self._pending_ui
+            self._pending_ui = {}
+            self._ui_flush_scheduled = False
+        for name, value in pending.items():
+            try:
+                target = getattr(self, name, None)
+                if target is None:
+                    continue
+                if isinstance(target, ttk.Progressbar):
+                    target.config(value=value)
+                elif isinstance(target, ttk.Label):
+                    target.configure(text=value)
+                else:
+                    target.set(value)
+            except Exception:
+                pass
+
+    def _log_write(self, line):
+        """Queue a line for the session log file (drained by _flush_log)."""
+        with self._log_buf_lock:
+            self._log_buf.append(line.encode('utf-8'))
+
+    def _flush_log(self):
+        """Drain queued log lines to the persistent fd periodically."""
+        try:
+            with self._log_buf_lock:
+                pending = self._log_buf
+                self._log_buf = []
+            if pending and self._log_fd is not None:
+                os.write(self._log_fd, b''.join(pending))
+        except Exception:
+            pass
+        # Schedule next flush
+        self.root.after(250, self._flush_log)
+
+    def _close_log(self):
+        """Write any queued lines and close the log fd (exit path)."""
+        try:
+            with self._log_buf_lock:
+                pending = self._log_buf
+                self._log_buf = []
+            if self._log_fd is not None:
+                if pending:
+                    os.write(self._log_fd, b''.join(pending))
+                os.close(self._log_fd)
+                self._log_fd = None
         except Exception:
             pass
 
-        # Schedule next UI watchdog check (every 2 seconds)
-        self.root.after(2000, self._schedule_ui_watchdog)
+    def _ack_liveness(self):
+        """Main-loop heartbeat: mark the UI alive and reschedule."""
+        self._ui_liveness.set()
+        self.root.after(500, self._ack_liveness)
+
+    def _ui_liveness_monitor(self):
+        """Daemon-thread watchdog that detects an actively frozen UI.
+
+        Checks every 2 seconds whether the main loop managed to post an
+        ack; after `_ui_timeout_threshold` seconds without one, logs a
+        warning directly to the log file (widget updates would just queue
+        behind the freeze).
+        """
+        missed = 0
+        warned = False
+        while True:
+            time.sleep(2)
+            if self._ui_liveness.is_set():
+                missed = 0
+                if warned:
+                    # Only pair a recovery line with an actual warning;
+                    # short stalls below the threshold stay silent
+                    warned = False
+                    try:
+                        self.root.after(0, lambda: self._log_receive(
+                            "[UI Timeout] GUI responsive again"))
+                    except Exception:
+                        pass
+            else:
+                missed += 1
+                if missed * 2 >= self._ui_timeout_threshold:
+                    warned = True
+                    try:
+                        if self._log_fd is not None:
+                            os.write(
+                                self._log_fd,
+                                (
+                                    f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] [WARNING] [RECV] "
+                                    f"[UI Timeout] GUI unresponsive for {missed * 2}s\n"
+                                ).encode('utf-8'),
+                            )
+                    except Exception:
+                        pass
+            self._ui_liveness.clear()
 
     def _get_status_image(self, color_hex: str, size: int = 12):
         """Return a small circular PhotoImage of the given color.
@@ -326,13 +837,14 @@ class FileTransferGUI:
         so callers can use a unicode emoji when PIL is not present.
         """
         try:
-            # reuse cached image if exists
-            key = f"{color_hex}_{size}"
+            # reuse cached image if exists (tuple key: no string build per call)
+            key = (color_hex, size)
             img = self._status_images.get(key)
             if img:
                 return img
 
-            if PIL_IMAGETK and Image is not None and ImageDraw is not None and ImageTk is not None:
+            Image, ImageDraw, ImageTk = _require_pil()
+            if Image is not None and ImageDraw is not None and ImageTk is not None:
                 im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
                 draw = ImageDraw.Draw(im)
                 draw.ellipse((1, 1, size - 2, size - 2), fill=color_hex)
@@ -345,37 +857,6 @@ class FileTransferGUI:
         except Exception:
             return None
 
-    def _ui_watchdog(self):
-        """Monitor GUI responsiveness; log warning if UI frozen."""
-        now = time.time()
-        time_since_response = now - self._ui_last_response_time
-        
-        if time_since_response > self._ui_timeout_threshold:
-            if not self._ui_frozen_recovered:
-                try:
-                    self._log_receive(f"[UI Timeout] GUI unresponsive for {time_since_response:.1f}s; attempting recovery...")
-                except Exception:
-                    pass
-                
-                # Attempt recovery: refresh discovery and UI
-                try:
-                    self._ui_frozen_recovered = True
-                    # Force a discovery refresh by calling update_machines_list
-                    self._update_machines_list()
-                except Exception:
-                    pass
-                
-                try:
-                    self._log_receive("[UI Timeout] UI recovery attempted")
-                except Exception:
-                    pass
-        else:
-            # UI is responsive; reset recovery flag
-            self._ui_frozen_recovered = False
-        
-        # Update last response time (called by main loop)
-        self._ui_last_response_time = now
-
     def _health_check(self):
         """Check if discovery is responsive; restart if stuck (common after PC standby)."""
         try:
@@ -383,38 +864,53 @@ class FileTransferGUI:
             # If the last poll happened more than 60 seconds ago, discovery may be stuck
             time_since_poll = now - self._last_poll_time
             
-            if time_since_poll > 60:
-                # Discovery appears stuck; try to recover
+            if time_since_poll > 60 and not self._restart_in_progress:
+                # Discovery appears stuck; recover on a worker thread.
+                # stop()+restart can block on socket teardown/bind, which on
+                # the Tk thread would cause exactly the freeze this check is
+                # meant to cure.
+                self._restart_in_progress = True
                 try:
                     self._log_receive(f"[Health Check] Discovery unresponsive ({time_since_poll:.0f}s); attempting recovery...")
                 except Exception:
                     pass
-                
-                # Stop and restart discovery
+
+                # Read Tk state here, while still on the UI thread
+                machine_name = self._hostname
                 try:
-                    if self.discovery:
-                        try:
-                            self.discovery.stop()
-                        except Exception:
-                            pass
-                        self.discovery = None
+                    port = int(self.receive_port_entry.get().strip())
                 except Exception:
-                    pass
-                
-                # Restart discovery
-                try:
-                    machine_name = socket.gethostname()
-                    try:
-                        port = int(self.receive_port_entry.get().strip())
-                    except Exception:
-                        port = 5000
-                    self._start_discovery(machine_name, port)
-                    self._log_receive("[Health Check] Discovery restarted successfully")
-                except Exception as e:
-                    self._log_receive(f"[Health Check] Failed to restart discovery: {e}")
+                    port = 5000
+                threading.Thread(
+                    target=self._restart_discovery_async,
+                    args=(machine_name, port),
+                    daemon=True,
+                ).start()
         except Exception:
             pass
 
+    def _restart_discovery_async(self, machine_name, port):
+        """Stop and restart discovery off the Tk thread (health-check recovery)."""
+        try:
+            try:
+                if self.discovery:
+                    try:
+                        self.discovery.stop()
+                    except Exception:
+                        pass
+                    self.discovery = None
+            except Exception:
+                pass
+            try:
+                self._start_discovery(machine_name, port)
+                self.root.after(0, lambda: self._log_receive("[Health Check] Discovery restarted successfully"))
+            except Exception as e:
+                self.root.after(0, lambda e=e: self._log_receive(f"[Health Check] Failed to restart discovery: {e}"))
+        finally:
+            # Give the restarted service a fresh window before the next check
+            self._last_poll_time = time.time()
+            self._restart_in_progress = False
+
     def _start_discovery(self, machine_name: str, port: int):
         """Create and start a ServiceDiscovery instance for this machine."""
         try:
@@ -430,7 +926,7 @@ class FileTransferGUI:
             self.discovery = ServiceDiscovery(
                 machine_name,
                 port,
-                callback=lambda: self.root.after(0, self._update_machines_list),
+                callback=lambda: self.root.after(0, self._update_machines_list_throttled),
                 broadcast=True,
                 broadcast_only=self.broadcast_only_var.get(),
             )
@@ -477,7 +973,7 @@ class FileTransferGUI:
             except Exception:
                 port = 5000
 
-            machine_name = socket.gethostname()
+            machine_name = self._hostname
 
             # If discovery running, stop and restart with new mode
             try:
@@ -515,7 +1011,7 @@ class FileTransferGUI:
     def start_discovery_service(self):
         """Start the single discovery service using a consistent machine name."""
         try:
-            machine_name = socket.gethostname()  # nome unico e coerente
+            machine_name = self._hostname  # nome unico e coerente
             # If the server is not listening, use a fallback discovery port
             # This allows the machine to be discovered even if it's not currently receiving files
             try:
@@ -557,12 +1053,15 @@ class FileTransferGUI:
         advanced_menu.add_command(
             label="Discovery IP Filter...", command=self._open_discovery_filter_dialog
         )
+        # Checkbuttons are bound to the persistent BooleanVars created in
+        # __init__; a throwaway var here would leave the checkmark and the
+        # attribute free to drift apart (and leak a Tcl variable per menu
+        # rebuild).
         advanced_menu.add_checkbutton(
-            label="Notify on file received (beep)", variable=(self.notify_on_receive_var if getattr(self, 'notify_on_receive_var', None) is not None else tk.BooleanVar(value=self.notify_on_receive)),
-            command=lambda: setattr(self, 'notify_on_receive', bool(self.notify_on_receive_var.get()) if getattr(self, 'notify_on_receive_var', None) is not None else not self.notify_on_receive)
+            label="Notify on file received (beep)", variable=self.notify_on_receive_var
         )
         advanced_menu.add_checkbutton(
-            label="Compress before send (ZIP)", variable=(self.compress_before_send_var if getattr(self, 'compress_before_send_var', None) is not None else tk.BooleanVar(value=self.compress_before_send)),
+            label="Compress before send (ZIP)", variable=self.compress_before_send_var,
             command=lambda: self._apply_compress_var()
         )
 
@@ -586,6 +1085,9 @@ class FileTransferGUI:
         help_menu.add_command(
             label="Discovery Diagnostics", command=self._run_diagnostics
         )
+        help_menu.add_command(
+            label="Refresh Local IP", command=self._refresh_local_ip
+        )
         help_menu.add_command(label="Quick Guide (IT)", command=self._open_quick_guide)
         help_menu.add_command(
             label="Quick Guide (EN)", command=self._open_quick_guide_en
@@ -624,7 +1126,7 @@ class FileTransferGUI:
             log_diag("[INFO] Starting discovery diagnostics...\n")
 
             # Test 1: Network info
-            log_diag(f"Machine: {socket.gethostname()}")
+            log_diag(f"Machine: {self._hostname}")
             log_diag(f"Local IP: {self._get_local_ip()}")
 
             # Test 2: Discovery status
@@ -650,21 +1152,33 @@ class FileTransferGUI:
 
             # Test 4: Network connectivity
             log_diag(f"\nNetwork Tests:")
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                s.bind(("", 5007))
+            if self.discovery:
+                # Ask the running discovery for the state of its live
+                # multicast socket instead of binding a fresh probe socket
+                # (a second bind of port 5007 can fail while the listener
+                # already holds the group).
+                ok, err = self.discovery.get_multicast_status()
+                if ok:
+                    log_diag(f"  - Multicast: OK (active listener)")
+                else:
+                    log_diag(f"  - Multicast: FAILED ({err})")
+            else:
+                # Discovery not running: do a one-off bind/join probe
+                try:
+                    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    s.bind(("", 5007))
 
-                import struct
+                    from service_discovery import _MREQ_ANY
 
-                mreq = struct.pack(
-                    "4sl", socket.inet_aton("239.255.77.77"), socket.INADDR_ANY
-                )
-                s.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-                log_diag(f"  - Multicast: OK")
-                s.close()
-            except Exception as e:
-                log_diag(f"  - Multicast: FAILED ({e})")
+                    mreq = _MREQ_ANY.pack(
+                        socket.inet_aton("239.255.77.77"), socket.INADDR_ANY
+                    )
+                    s.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+                    log_diag(f"  - Multicast: OK")
+                    s.close()
+                except Exception as e:
+                    log_diag(f"  - Multicast: FAILED ({e})")
 
             log_diag(f"\nTips:")
             log_diag(f"1. Make sure at least 2 computers are running this app")
@@ -693,6 +1207,23 @@ class FileTransferGUI:
 
     def _open_quick_guide(self):
         """Open a small Quick Guide and Troubleshooting help window (Italian)."""
+        self._show_quick_guide('it', _QUICK_GUIDE_IT)
+
+    def _show_quick_guide(self, lang, content):
+        """Show the (cached) Quick Guide window for the given language.
+
+        The Toplevel is built once and re-shown on later invocations, so
+        repeat Help opens skip the widget construction cost entirely.
+        """
+        win = self._quick_guide_wins.get(lang)
+        try:
+            if win is not None and win.winfo_exists():
+                win.deiconify()
+                win.lift()
+                return
+        except Exception:
+            pass
+
         guide = tk.Toplevel(self.root)
         guide.title("Quick Guide & Troubleshooting")
         guide.geometry("600x500")
@@ -702,31 +1233,12 @@ class FileTransferGUI:
             guide, wrap=tk.WORD, state="normal", font=("Arial", 10)
         )
         text.pack(fill="both", expand=True, padx=10, pady=10)
-
-        guide_content = (
-            "Breve guida al programma\n"
-            "-----------------------\n\n"
-            "Come funziona (sintesi):\n"
-            "- Questo programma usa UDP (multicast/broadcast) per scoprire altri computer in rete.\n"
-            "- Usa TCP per il trasferimento affidabile dei file.\n"
-            "- Puoi avviare il ricevitore (Start Receiver) su una macchina e inviare file da un'altra.\n\n"
-            "Passi rapidi per inviare/ricevere file:\n"
-            "1) Su chi riceve: apri la tab 'Receive Files' -> imposta la cartella e clicca 'Start Receiver'.\n"
-            "2) Su chi invia: seleziona il destinatario dalla lista 'Discovered Machines' o usa 'Manual Connection...'.\n"
-            "3) Aggiungi File o Cartelle nella tab 'Send Files' e premi 'Send'.\n\n"
-            "Problemi comuni e risoluzioni rapide:\n"
-            "- Non vedo altri computer nella lista: controlla che tutte le macchine siano nella stessa rete e che il firewall non blocchi UDP 5007. Usa 'Discovery Diagnostics' per verificare.\n"
-            "- Il file non arriva: assicurati che il ricevitore abbia premuto 'Start Receiver' e che la porta mostrata sia raggiungibile (default 5000). Prova la 'Manual Connection' inserendo l'IP del ricevente.\n"
-            "- Ricevo l'avviso 'No incoming connections': il programma mostra un indicatore arancione se il server ascolta ma non riceve connessioni; spesso è un firewall o la porta non è inoltrata. Apri le impostazioni di rete o disattiva temporaneamente il firewall per test.\n\n"
-            "Suggerimenti avanzati:\n"
-            "- Se la scoperta non funziona, usa sempre 'Manual Connection' con IP e porta.\n"
-            "- Per trasferimenti multipli grandi, verifica spazio su disco nella cartella di destinazione.\n"
-            "- Usa i log nelle tabs 'Transfer Log' e 'Receiver Log' per vedere messaggi di errore e diagnostica.\n\n"
-            "Se hai bisogno di aiuto avanzato, invia i messaggi dei log (dal menu) o apri un issue su GitHub con dettagli di rete e gli output della 'Discovery Diagnostics'.\n"
-        )
-
-        text.insert(tk.END, guide_content)
+        text.insert(tk.END, content)
         text.config(state="disabled")
+
+        # Hide instead of destroy so the window can be re-shown cheaply
+        guide.protocol("WM_DELETE_WINDOW", guide.withdraw)
+        self._quick_guide_wins[lang] = guide
         try:
             self._ensure_dialog_visible(guide)
         except Exception:
@@ -737,31 +1249,26 @@ class FileTransferGUI:
 
         This makes it easier for the app to open plain-text files on demand.
         """
-        try:
-            base = Path(__file__).parent
-        except Exception:
-            return
+        base = self._base_dir
 
         pairs = [
             ("QUICK_START.md", "QUICK_START.txt"),
             ("README.md", "README.txt"),
         ]
 
+        # One scandir pass instead of two stat calls per doc pair
+        try:
+            entries = {e.name for e in os.scandir(base)}
+        except Exception:
+            return
+
         for md_name, txt_name in pairs:
             try:
-                md_path = base / md_name
-                txt_path = base / txt_name
-                if md_path.exists() and not txt_path.exists():
-                    try:
-                        with open(md_path, 'r', encoding='utf-8') as rf:
-                            content = rf.read()
-                        # Write raw markdown to .txt (preserve readable content)
-                        with open(txt_path, 'w', encoding='utf-8') as wf:
-                            wf.write(content)
-                    except Exception:
-                        # If writing fails, skip silently
-                        pass
+                if md_name in entries and txt_name not in entries:
+                    # copyfile uses the OS fast path (sendfile on Linux)
+                    shutil.copyfile(base / md_name, base / txt_name)
             except Exception:
+                # If copying fails, skip silently
                 pass
 
     def _refresh_docs_txt(self):
@@ -778,37 +1285,8 @@ class FileTransferGUI:
 
     def _open_quick_guide_en(self):
         """Open a small Quick Guide and Troubleshooting help window (English)."""
-        guide = tk.Toplevel(self.root)
-        guide.title("Quick Guide & Troubleshooting")
-        guide.geometry("600x500")
-        guide.transient(self.root)
-
-        text = scrolledtext.ScrolledText(
-            guide, wrap=tk.WORD, state="normal", font=("Arial", 10)
-        )
-        text.pack(fill="both", expand=True, padx=10, pady=10)
+        self._show_quick_guide('en', _QUICK_GUIDE_EN)
 
-        guide_content = (
-            "Quick Guide\n"
-            "-----------------------\n\n"
-            "How it works (summary):\n"
-            "- This app uses UDP (multicast/broadcast) to discover other computers on the local network.\n"
-            "- It uses TCP for reliable file transfers.\n"
-            "- Start the receiver on one machine and send files from another.\n\n"
-            "Quick steps to send/receive files:\n"
-            "1) On the receiver: open 'Receive Files' -> set the folder and click 'Start Receiver'.\n"
-            "2) On the sender: select the receiver from 'Discovered Machines' or use 'Manual Connection...'.\n"
-            "3) Add Files or Folders in the 'Send Files' tab and click 'Send'.\n\n"
-            "Common problems and quick fixes:\n"
-            "- No machines in the list: ensure all computers are on the same network and that UDP port 5007 is not blocked by firewall. Use 'Discovery Diagnostics' to check.\n"
-            "- File doesn't arrive: ensure the receiver pressed 'Start Receiver' and the port (default 5000) is reachable. Try 'Manual Connection' with the receiver IP.\n"
-            "- 'No incoming connections' warning: the app shows an orange indicator if the server listens but receives no connections; this often indicates a firewall or network configuration blocking the port. Check firewall settings or allow the app through the firewall for testing.\n\n"
-            "Advanced tips:\n"
-            "- If discovery fails, always try 'Manual Connection' with IP and port.\n"
-            "- For large transfers, verify available disk space on the destination folder.\n"
-            "- Check 'Transfer Log' and 'Receiver Log' for detailed messages and errors.\n\n"
-            "If you need more help, collect the logs and diagnostics output and open an issue on GitHub including network details and the diagnostics output.\n"
-        )
     def _send_logs(self):
         """Collect GUI logs and let the user save them (Save As), open the saved file and copy path to clipboard."""
         try:
@@ -837,26 +1315,34 @@ class FileTransferGUI:
                 return  # user cancelled
 
             out_path = Path(save_path)
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(
-                    f"File Transfer App Logs - {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                )
-                f.write("--- SEND LOG ---\n")
-                f.write(send_text or "(empty)\n")
-                f.write("\n--- RECEIVE LOG ---\n")
-                f.write(recv_text or "(empty)\n")
+            # One buffered writelines call instead of six small writes
+            parts = [
+                f"File Transfer App Logs - {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                "--- SEND LOG ---\n",
+                send_text or "(empty)\n",
+                "\n--- RECEIVE LOG ---\n",
+                recv_text or "(empty)\n",
+            ]
+            with open(out_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+                f.writelines(parts)
+
+            # Open the saved file for the user on a worker thread: on
+            # Windows os.startfile resolves the association synchronously
+            # and spawning xdg-open/open can also stall, so keep it off the
+            # Tk mainloop.
+            def _launch_viewer():
+                try:
+                    if sys.platform.startswith("win"):
+                        os.startfile(str(out_path))
+                    else:
+                        import subprocess
 
-            # Open the saved file for the user
-            try:
-                if sys.platform.startswith("win"):
-                    os.startfile(str(out_path))
-                else:
-                    import subprocess
+                        opener = "open" if sys.platform == "darwin" else "xdg-open"
+                        subprocess.Popen([opener, str(out_path)])
+                except Exception:
+                    pass
 
-                    opener = "open" if sys.platform == "darwin" else "xdg-open"
-                    subprocess.Popen([opener, str(out_path)])
-            except Exception:
-                pass
+            threading.Thread(target=_launch_viewer, daemon=True).start()
 
             # Copy path to clipboard for easy pasting
             try:
@@ -875,22 +1361,17 @@ class FileTransferGUI:
     # System tray helpers
     # -------------------------
     def _create_tray_image(self, size=64, color=(52, 152, 219)):
-        """Create a simple circular tray icon (Pillow Image)."""
-        if not TRAY_AVAILABLE or Image is None or ImageDraw is None:
-            return None
-        try:
-            img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            # draw a filled circle
-            margin = int(size * 0.12)
-            draw.ellipse((margin, margin, size - margin, size - margin), fill=color)
-            return img
-        except Exception:
-            return None
+        """Create a simple circular tray icon (Pillow Image).
+
+        The icon is static, so it is rasterized once per (size, color) and
+        reused across tray restarts.
+        """
+        return _build_tray_image(size, color)
 
     def _init_tray(self):
         """Initialize and run the system tray icon in a background thread."""
-        if not TRAY_AVAILABLE or pystray is None:
+        pystray = _require_tray()
+        if pystray is None:
             return
 
         def _on_show(icon, item):
@@ -948,16 +1429,27 @@ class FileTransferGUI:
                 "file_transfer_app", image, "File Transfer", menu
             )
 
-            t = threading.Thread(target=self._tray_icon.run, daemon=True)
-            t.start()
+            # Prefer run_detached (pystray >= 0.19): the backend runs its
+            # own blocking loop and icon.stop() from the Exit item is the
+            # wakeup, so the icon costs no CPU while idle in the tray.
+            try:
+                self._tray_icon.run_detached()
+            except (AttributeError, NotImplementedError):
+                t = threading.Thread(target=self._tray_icon.run, daemon=True)
+                t.start()
         except Exception:
             self._tray_icon = None
 
     def _hide_to_tray(self):
         try:
-            # Persist preferences before hiding to tray so settings remain after closing
+            # Persist preferences before hiding to tray so settings remain
+            # after closing; Tk values are snapshotted here and only the
+            # file write runs off the UI thread, so the window disappears
+            # instantly without the worker touching Tcl
             try:
-                self._write_config()
+                self._io_executor.submit(
+                    self._write_config_data, self._config_snapshot()
+                )
             except Exception:
                 pass
             self.root.withdraw()
@@ -977,47 +1469,102 @@ class FileTransferGUI:
             pass
 
     def _load_transfer_history(self):
-        """Load transfer history from JSON file."""
+        """Load transfer history from the JSONL file (one entry per line).
+
+        Falls back to the legacy single-JSON file from older versions and
+        migrates it to JSONL on first run. The in-memory deque keeps only
+        the most recent entries, so load time stays bounded no matter how
+        large the on-disk history grows.
+        """
         try:
             if self._history_path.exists():
                 with open(self._history_path, 'r', encoding='utf-8') as f:
-                    self.transfer_history = json.load(f)
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self.transfer_history.append(_json_loads(line))
+                        except Exception:
+                            continue
+            elif self._legacy_history_path.exists():
+                # One-time migration from the old full-file JSON format
+                with open(self._legacy_history_path, 'rb') as f:
+                    for entry in _json_loads(f.read()):
+                        self.transfer_history.append(entry)
+                self._save_transfer_history()
+                try:
+                    self._legacy_history_path.unlink()
+                except Exception:
+                    pass
         except Exception:
-            self.transfer_history = []
+            self.transfer_history.clear()
 
     def _save_transfer_history(self):
-        """Save transfer history to JSON file."""
+        """Rewrite the full JSONL history file from the in-memory ring.
+
+        Normal operation only appends; this is for migration and for
+        clearing fallbacks.
+        """
         try:
-            with open(self._history_path, 'w', encoding='utf-8') as f:
-                json.dump(self.transfer_history[-100:], f, indent=2)  # Keep last 100 entries
+            with open(self._history_path, 'wb') as f:
+                f.writelines(_json_dumps(entry) + b'\n' for entry in self.transfer_history)
+            # Everything in the ring is now on disk
+            self._history_pending = []
         except Exception:
             pass
 
     def _add_transfer_history(self, transfer_type, filename, size_bytes, duration_sec):
         """Add entry to transfer history (type: 'send' or 'recv')."""
         try:
+            mb = size_bytes * _MB_INV
             entry = {
                 'type': transfer_type,
                 'filename': filename,
                 'size_bytes': size_bytes,
+                'size_mb': mb,
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'duration_sec': duration_sec,
-                'speed_mbps': (size_bytes / (1024 * 1024)) / max(0.1, duration_sec)
+                'speed_mbps': mb / max(0.1, duration_sec)
             }
             self.transfer_history.append(entry)
-            self._save_transfer_history()
+            # Debounced append: rapid adds (e.g. a folder of small files)
+            # coalesce into one disk write per second
+            self._history_pending.append(entry)
+            if not self._history_flush_pending:
+                self._history_flush_pending = True
+                self.root.after(1000, self._flush_history)
+        except Exception:
+            pass
+
+    def _flush_history(self):
+        """Append pending history entries to the JSONL file (debounced)."""
+        self._history_flush_pending = False
+        if not self._history_pending:
+            return
+        pending, self._history_pending = self._history_pending, []
+        try:
+            with open(self._history_path, 'ab') as f:
+                f.writelines(_json_dumps(e) + b'\n' for e in pending)
         except Exception:
             pass
 
     def _notify_file_received(self, filename):
-        """Notify user of new received file (beep + visual)."""
+        """Notify user of new received file (beep + visual).
+
+        Called once per file, so it early-returns when notifications are
+        off and throttles the bell to one per 500ms so a folder of small
+        files doesn't produce an audible pileup.
+        """
+        if not self.notify_on_receive:
+            return
+        now = time.monotonic()
+        if now - self._last_bell_time < 0.5:
+            return
+        self._last_bell_time = now
+        # Beep (platform-agnostic using tkinter)
         try:
-            if self.notify_on_receive:
-                # Beep (platform-agnostic using tkinter)
-                try:
-                    self.root.bell()
-                except Exception:
-                    pass
+            self.root.bell()
         except Exception:
             pass
 
@@ -1029,26 +1576,39 @@ class FileTransferGUI:
             hist_win.geometry("700x400")
             hist_win.transient(self.root)
 
-            # Text widget with scrollbar
-            text = scrolledtext.ScrolledText(hist_win, height=20, state="disabled", font=("Courier", 9))
-            text.pack(fill="both", expand=True, padx=10, pady=10)
+            # Treeview with scrollbar: unlike a text dump it only renders
+            # the visible rows, so scrolling stays smooth however large the
+            # history grows
+            tree_frame = ttk.Frame(hist_win)
+            tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            columns = ("type", "ts", "fname", "size", "dur", "spd")
+            tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=20)
+            for col, heading, width in (
+                ("type", "Type", 60),
+                ("ts", "Timestamp", 140),
+                ("fname", "Filename", 220),
+                ("size", "Size", 80),
+                ("dur", "Duration", 80),
+                ("spd", "Speed", 90),
+            ):
+                tree.heading(col, text=heading)
+                tree.column(col, width=width, stretch=(col == "fname"))
+            scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+            tree.config(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            tree.pack(side=tk.LEFT, fill="both", expand=True)
 
-            # Format history
-            text.config(state="normal")
             if not self.transfer_history:
-                text.insert(tk.END, "No transfers recorded yet.\n")
-            else:
-                text.insert(tk.END, f"{'Type':<6} {'Timestamp':<20} {'Filename':<30} {'Size':<10} {'Duration':<10} {'Speed':<10}\n")
-                text.insert(tk.END, "-" * 100 + "\n")
-                for entry in self.transfer_history[-50:]:  # Show last 50
-                    ttype = entry.get('type', 'unk')
-                    ts = entry.get('timestamp', '')
-                    fname = entry.get('filename', '')[:30]
-                    size = f"{entry.get('size_bytes', 0) / (1024*1024):.1f}MB"
-                    dur = f"{entry.get('duration_sec', 0):.1f}s"
-                    spd = f"{entry.get('speed_mbps', 0):.2f}MB/s"
-                    text.insert(tk.END, f"{ttype:<6} {ts:<20} {fname:<30} {size:<10} {dur:<10} {spd:<10}\n")
-            text.config(state="disabled")
+                ttk.Label(hist_win, text="No transfers recorded yet.").pack(pady=4)
+            for entry in self.transfer_history:
+                tree.insert("", "end", values=(
+                    entry.get('type', 'unk'),
+                    entry.get('timestamp', ''),
+                    entry.get('filename', ''),
+                    f"{entry.get('size_mb', entry.get('size_bytes', 0) * _MB_INV):.1f}MB",
+                    f"{entry.get('duration_sec', 0):.1f}s",
+                    f"{entry.get('speed_mbps', 0):.2f}MB/s",
+                ))
 
             # Close button
             ttk.Button(hist_win, text="Close", command=hist_win.destroy).pack(pady=10)
@@ -1069,21 +1629,18 @@ class FileTransferGUI:
             )
             if not path:
                 return
-            # Write CSV
+            # Write CSV in one bulk writerows call; itemgetter extracts the
+            # row tuples in C, so no Python-level loop runs per entry
+            # (_add_transfer_history always builds entries with these keys)
             import csv
+            from operator import itemgetter
 
-            with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+            fields = ("type", "filename", "size_bytes", "timestamp", "duration_sec", "speed_mbps")
+            row = itemgetter(*fields)
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow(["type", "filename", "size_bytes", "timestamp", "duration_sec", "speed_mbps"])
-                for entry in self.transfer_history:
-                    writer.writerow([
-                        entry.get('type', ''),
-                        entry.get('filename', ''),
-                        entry.get('size_bytes', 0),
-                        entry.get('timestamp', ''),
-                        entry.get('duration_sec', 0),
-                        entry.get('speed_mbps', 0),
-                    ])
+                writer.writerow(fields)
+                writer.writerows(map(row, self.transfer_history))
             messagebox.showinfo("Export Transfer History", f"Exported {len(self.transfer_history)} entries to {path}")
             self._log_send(f"Exported transfer history to {path}")
         except Exception as e:
@@ -1094,16 +1651,12 @@ class FileTransferGUI:
         try:
             if not messagebox.askyesno("Clear Transfer History", "Are you sure you want to clear the stored transfer history? This cannot be undone."):
                 return
-            self.transfer_history = []
+            self.transfer_history.clear()
+            self._history_pending = []
             try:
-                if self._history_path.exists():
-                    try:
-                        self._history_path.unlink()
-                    except Exception:
-                        # fallback: overwrite
-                        self._save_transfer_history()
-                else:
-                    self._save_transfer_history()
+                # Truncate the JSONL file in place
+                with open(self._history_path, 'w', encoding='utf-8'):
+                    pass
             except Exception:
                 pass
             self._log_send("Transfer history cleared by user")
@@ -1130,13 +1683,31 @@ class FileTransferGUI:
         except Exception:
             pass
         try:
-            self._write_config()
+            # Snapshot Tk state here on the UI thread, queue the pure-I/O
+            # write behind any in-flight one, then drain the queue. The
+            # worker never touches Tcl, so waiting cannot deadlock the
+            # blocked event loop and the final state reliably lands on
+            # disk before the interpreter goes away.
+            self._io_executor.submit(
+                self._write_config_data, self._config_snapshot()
+            )
+        except Exception:
+            pass
+        try:
+            self._io_executor.shutdown(wait=True)
         except Exception:
             pass
         try:
+            # Compact the append-only history file down to the in-memory
+            # ring so it doesn't grow without bound across sessions
             self._save_transfer_history()
         except Exception:
             pass
+        try:
+            # Drain any queued log lines before the interpreter goes away
+            self._close_log()
+        except Exception:
+            pass
         try:
             self.root.destroy()
         except Exception:
@@ -1154,20 +1725,18 @@ class FileTransferGUI:
             # Defaults
             default_port = "5000"
             default_output = os.path.join(os.getcwd(), "ReceivedFiles")
-            default_name = socket.gethostname()
+            default_name = self._hostname
 
             # Reset UI fields
             try:
                 self.receive_port_entry.config(state="normal")
-                self.receive_port_entry.delete(0, tk.END)
-                self.receive_port_entry.insert(0, default_port)
+                self.receive_port_var.set(default_port)
             except Exception:
                 pass
 
             try:
                 self.machine_name_entry.config(state="normal")
-                self.machine_name_entry.delete(0, tk.END)
-                self.machine_name_entry.insert(0, default_name)
+                self.machine_name_var.set(default_name)
             except Exception:
                 pass
 
@@ -1181,6 +1750,18 @@ class FileTransferGUI:
                 self.broadcast_only_var.set(False)
             except Exception:
                 pass
+            # Reset socket buffer preference (OS default)
+            try:
+                self.socket_buffer_kb = 0
+            except Exception:
+                pass
+
+            # Reset compression level
+            try:
+                self.compress_level = 1
+            except Exception:
+                pass
+
             # Reset partial cleanup preference
             try:
                 self.partial_cleanup_days = 30
@@ -1213,32 +1794,55 @@ class FileTransferGUI:
             messagebox.showerror("Error", f"Could not reset preferences: {e}")
 
     def _open_manual_connection_dialog(self):
-        """Dialog for manual IP/port configuration"""
-        current_host = self.host_entry.get().strip()
-        current_port = self.send_port_entry.get().strip() or "5000"
+        """Dialog for manual IP/port configuration.
 
-        host = simpledialog.askstring(
-            "Manual Connection", "Receiver IP Address:", initialvalue=current_host or ""
-        )
-        if host is None or not host.strip():
-            return
+        A single Toplevel with both fields (instead of two chained modal
+        askstring prompts, each with its own nested event loop).
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Manual Connection")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.geometry("300x150")
 
-        port_str = simpledialog.askstring(
-            "Manual Connection", "Port:", initialvalue=current_port
-        )
-        if port_str is None:
-            return
+        host_var = tk.StringVar(value=self.host_entry.get().strip())
+        port_var = tk.StringVar(value=self.send_port_entry.get().strip() or "5000")
 
-        try:
-            int(port_str)
-        except ValueError:
-            messagebox.showerror("Error", "Port must be a number.")
-            return
+        frame = ttk.Frame(dialog)
+        frame.pack(padx=10, pady=10, fill="x")
+        ttk.Label(frame, text="Receiver IP Address:").grid(row=0, column=0, sticky=tk.W, pady=4)
+        host_entry = ttk.Entry(frame, textvariable=host_var, width=20)
+        host_entry.grid(row=0, column=1, padx=5, pady=4)
+        ttk.Label(frame, text="Port:").grid(row=1, column=0, sticky=tk.W, pady=4)
+        ttk.Entry(frame, textvariable=port_var, width=20).grid(row=1, column=1, padx=5, pady=4)
+
+        def save_connection():
+            host = host_var.get().strip()
+            port_str = port_var.get().strip()
+            if not host:
+                messagebox.showerror("Error", "Please enter an IP address.", parent=dialog)
+                return
+            try:
+                int(port_str)
+            except ValueError:
+                messagebox.showerror("Error", "Port must be a number.", parent=dialog)
+                return
+            self.host_var.set(host)
+            self.send_port_var.set(port_str)
+            dialog.destroy()
+
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="Save", command=save_connection).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
 
-        self.host_entry.delete(0, tk.END)
-        self.host_entry.insert(0, host.strip())
-        self.send_port_entry.delete(0, tk.END)
-        self.send_port_entry.insert(0, port_str.strip())
+        host_entry.focus_set()
+        dialog.bind("<Return>", lambda e: save_connection())
+        try:
+            self._ensure_dialog_visible(dialog)
+        except Exception:
+            pass
+        dialog.wait_window()
 
     def _open_discovery_filter_dialog(self):
         """Dialog to set optional IP subnet filter for discovery."""
@@ -1249,7 +1853,7 @@ class FileTransferGUI:
         dialog.geometry("300x150")
 
         ttk.Label(dialog, text="Filter discovery by IP subnet (optional):").pack(padx=10, pady=10)
-        ttk.Label(dialog, text="Examples: 192.168.1., 10.0., or leave empty for no filter", font=("Arial", 8)).pack(padx=10)
+        ttk.Label(dialog, text="Examples: 192.168.1., 10.0., or leave empty for no filter", font="AppTiny").pack(padx=10)
 
         frame = ttk.Frame(dialog)
         frame.pack(padx=10, pady=10, fill="x")
@@ -1332,6 +1936,26 @@ class FileTransferGUI:
         )
         auto_cleanup_chk.pack(side=tk.LEFT, padx=8)
 
+        # Socket buffer tuning (applied on next server start)
+        frame_sock = ttk.Frame(dialog)
+        frame_sock.pack(fill="x", padx=10, pady=5)
+        ttk.Label(frame_sock, text="Socket buffer (KB, 0 = system default):").pack(
+            side=tk.LEFT
+        )
+        sockbuf_var = tk.StringVar(value=str(getattr(self, "socket_buffer_kb", 0)))
+        sockbuf_entry = ttk.Entry(frame_sock, textvariable=sockbuf_var, width=8)
+        sockbuf_entry.pack(side=tk.LEFT, padx=5)
+
+        # Compression level for compress-before-send (1 = fastest)
+        frame_clevel = ttk.Frame(dialog)
+        frame_clevel.pack(fill="x", padx=10, pady=5)
+        ttk.Label(frame_clevel, text="Compression level (1-9, 1 = fastest):").pack(
+            side=tk.LEFT
+        )
+        clevel_var = tk.StringVar(value=str(getattr(self, "compress_level", 1)))
+        clevel_entry = ttk.Entry(frame_clevel, textvariable=clevel_var, width=4)
+        clevel_entry.pack(side=tk.LEFT, padx=5)
+
         # Save folder
         frame_dir = ttk.Frame(dialog)
         frame_dir.pack(fill="x", padx=10, pady=5)
@@ -1363,10 +1987,8 @@ class FileTransferGUI:
             except ValueError:
                 messagebox.showerror("Error", "Port must be a number.")
                 return
-            self.machine_name_entry.delete(0, tk.END)
-            self.machine_name_entry.insert(0, name_var.get().strip())
-            self.receive_port_entry.delete(0, tk.END)
-            self.receive_port_entry.insert(0, recv_port_var.get().strip())
+            self.machine_name_var.set(name_var.get().strip())
+            self.receive_port_var.set(recv_port_var.get().strip())
             self.output_dir_var.set(dir_var.get().strip())
             # If server is running, update its output directory immediately
             try:
@@ -1398,10 +2020,20 @@ class FileTransferGUI:
             try:
                 new_port = int(recv_port_var.get().strip())
                 # Use hostname as machine name to keep consistency
-                self._start_discovery(socket.gethostname(), new_port)
+                self._start_discovery(self._hostname, new_port)
             except Exception:
                 pass
 
+            # Save socket buffer preference (validated/clamped)
+            self.socket_buffer_kb = self._validated_socket_buffer(
+                sockbuf_var.get().strip()
+            )
+
+            # Save compression level preference (clamped to 1-9)
+            self.compress_level = self._validated_compress_level(
+                clevel_var.get().strip()
+            )
+
             # Persist config (broadcast-only preference)
             try:
                 self._write_config()
@@ -1448,6 +2080,10 @@ class FileTransferGUI:
 
         main_frame = ttk.Frame(self.send_frame)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Freeze size propagation while the ~50 children pack; re-enabled
+        # at the end of the method so Tk does one relayout instead of
+        # recomputing the requested size after every pack()
+        main_frame.pack_propagate(False)
 
         # Receiver selection
         left_frame = ttk.LabelFrame(main_frame, text="Receiver Selection")
@@ -1484,14 +2120,17 @@ class FileTransferGUI:
         ttk.Label(manual_frame, text="IP Address:").grid(
             row=0, column=0, sticky=tk.W, padx=5, pady=2
         )
-        self.host_entry = ttk.Entry(manual_frame, width=15)
+        # StringVar-backed entries: updating the var is one Tcl call vs
+        # the two (delete+insert) needed to rewrite a bare Entry
+        self.host_var = tk.StringVar()
+        self.host_entry = ttk.Entry(manual_frame, width=15, textvariable=self.host_var)
         self.host_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
 
         ttk.Label(manual_frame, text="Port:").grid(
             row=0, column=2, sticky=tk.W, padx=5, pady=2
         )
-        self.send_port_entry = ttk.Entry(manual_frame, width=8)
-        self.send_port_entry.insert(0, "5000")
+        self.send_port_var = tk.StringVar(value="5000")
+        self.send_port_entry = ttk.Entry(manual_frame, width=8, textvariable=self.send_port_var)
         self.send_port_entry.grid(row=0, column=3, sticky=tk.W, padx=5, pady=2)
 
         right_frame = ttk.LabelFrame(main_frame, text="File Transfer")
@@ -1513,17 +2152,18 @@ class FileTransferGUI:
         self.files_listbox.config(yscrollcommand=file_scrollbar.set)
         file_scrollbar.config(command=self.files_listbox.yview)
 
+        dnd_files, _ = _require_dnd()
         try:
-            if TKDND_AVAILABLE and DND_FILES:
+            if dnd_files:
 
-                self.files_listbox.drop_target_register(DND_FILES)
+                self.files_listbox.drop_target_register(dnd_files)
                 self.files_listbox.dnd_bind("<<Drop>>", self._on_files_dropped)
         except Exception:
             pass
 
         # Fallback: bind Ctrl+V for clipboard paste if DnD not available
         try:
-            if not TKDND_AVAILABLE:
+            if not dnd_files:
                 self.files_listbox.bind("<Control-v>", lambda e: self._paste_files_from_clipboard())
         except Exception:
             pass
@@ -1535,7 +2175,7 @@ class FileTransferGUI:
             btn_frame, text="📄 Add File(s)", command=self._browse_files_multiple
         )
         add_file_btn.pack(side=tk.LEFT, padx=2)
-        if TKDND_AVAILABLE:
+        if dnd_files:
             self._create_tooltip(add_file_btn, "Select one or more files to send (or drag & drop onto list)")
         else:
             self._create_tooltip(add_file_btn, "Select one or more files to send (drag & drop: copy files, Ctrl+V to paste)")
@@ -1561,11 +2201,14 @@ class FileTransferGUI:
         receiver_info_frame = ttk.LabelFrame(right_frame, text="Selected Receiver")
         receiver_info_frame.pack(anchor=tk.W, padx=5, pady=8, fill="x")
         self.selected_receiver_var = tk.StringVar(value="🔴 No receiver selected")
+        # compound/foreground are set once here; selection handlers only
+        # swap the image reference and the StringVar text
         self.selected_receiver_label = ttk.Label(
             receiver_info_frame,
             textvariable=self.selected_receiver_var,
             font=("Arial", 10, "bold"),
             foreground="darkgreen",
+            compound="left",
         )
         self.selected_receiver_label.pack(anchor=tk.W, padx=5, pady=4)
         # Discovery mode indicator for Send tab (shows broadcast vs multicast)
@@ -1622,7 +2265,7 @@ class FileTransferGUI:
             progress_frame,
             textvariable=self.progress_percent_var,
             width=5,
-            font=("Arial", 9),
+            font="AppSmall",
         )
         self.progress_percent_label.pack(side=tk.LEFT, padx=5)
 
@@ -1630,7 +2273,7 @@ class FileTransferGUI:
         bytes_frame.pack(fill="x", padx=5, pady=2)
         self.bytes_transferred_var = tk.StringVar(value="0 B / 0 B")
         ttk.Label(
-            bytes_frame, textvariable=self.bytes_transferred_var, font=("Arial", 9)
+            bytes_frame, textvariable=self.bytes_transferred_var, font="AppSmall"
         ).pack(side=tk.LEFT)
 
         info_frame = ttk.Frame(right_frame)
@@ -1668,29 +2311,38 @@ class FileTransferGUI:
             log_ctrl_frame, text="🗑 Clear", command=lambda: self._clear_log("send")
         ).pack(side=tk.RIGHT, padx=2)
 
-        self.send_log = scrolledtext.ScrolledText(
-            log_frame, height=12, state="disabled", font=("Courier", 8)
+        # Plain Text + explicit scrollbar: lighter than ScrolledText,
+        # which re-syncs its scrollbar on every insert
+        self.send_log = tk.Text(
+            log_frame, height=12, state="disabled", font="AppMono"
         )
-        self.send_log.pack(fill="both", expand=True)
+        send_log_sb = ttk.Scrollbar(log_frame, command=self.send_log.yview)
+        self.send_log.configure(yscrollcommand=send_log_sb.set)
+        send_log_sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.send_log.pack(side=tk.LEFT, fill="both", expand=True)
+
+        main_frame.pack_propagate(True)
 
     def _create_receive_tab(self):
         """Create the receive files tab"""
         main_frame = ttk.Frame(self.receive_frame)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Same construction-time layout freeze as _create_send_tab
+        main_frame.pack_propagate(False)
 
         left_frame = ttk.LabelFrame(main_frame, text="Receiver Configuration")
         left_frame.pack(side=tk.LEFT, fill="both", padx=5, pady=5)
 
         # Machine name (kept for display but discovery uses hostname)
         ttk.Label(left_frame, text="Machine Name:").pack(anchor=tk.W, padx=5, pady=2)
-        self.machine_name_entry = ttk.Entry(left_frame)
-        self.machine_name_entry.insert(0, socket.gethostname())
+        self.machine_name_var = tk.StringVar(value=self._hostname)
+        self.machine_name_entry = ttk.Entry(left_frame, textvariable=self.machine_name_var)
         self.machine_name_entry.pack(fill="x", padx=5, pady=2)
 
         # Port
         ttk.Label(left_frame, text="Listen Port:").pack(anchor=tk.W, padx=5, pady=2)
-        self.receive_port_entry = ttk.Entry(left_frame)
-        self.receive_port_entry.insert(0, "5000")
+        self.receive_port_var = tk.StringVar(value="5000")
+        self.receive_port_entry = ttk.Entry(left_frame, textvariable=self.receive_port_var)
         self.receive_port_entry.pack(fill="x", padx=5, pady=2)
 
         # Output directory
@@ -1702,6 +2354,10 @@ class FileTransferGUI:
         self.output_dir_var = tk.StringVar(
             value=os.path.join(os.getcwd(), "ReceivedFiles")
         )
+        # Mirror the var into a plain string so per-file hot paths
+        # (_add_recent_file) skip the Tcl round-trip of .get()
+        self._output_dir_cached = self.output_dir_var.get()
+        self.output_dir_var.trace_add("write", self._on_output_dir_changed)
         self.dir_entry = ttk.Entry(dir_frame, textvariable=self.output_dir_var)
         self.dir_entry.pack(side=tk.LEFT, fill="x", expand=True)
 
@@ -1782,34 +2438,40 @@ class FileTransferGUI:
             log_ctrl_frame, text="🗑 Clear", command=lambda: self._clear_log("recv")
         ).pack(side=tk.RIGHT, padx=2)
 
-        self.receive_log = scrolledtext.ScrolledText(
-            log_frame, height=12, state="disabled", font=("Courier", 8)
+        # Plain Text + explicit scrollbar (see send-tab log)
+        self.receive_log = tk.Text(
+            log_frame, height=12, state="disabled", font="AppMono"
         )
-        self.receive_log.pack(fill="both", expand=True)
+        recv_log_sb = ttk.Scrollbar(log_frame, command=self.receive_log.yview)
+        self.receive_log.configure(yscrollcommand=recv_log_sb.set)
+        recv_log_sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.receive_log.pack(side=tk.LEFT, fill="both", expand=True)
 
         # Receive progress area
         recv_progress_frame = ttk.Frame(right_frame)
         recv_progress_frame.pack(fill="x", padx=5, pady=(5, 8))
         self.recv_progress = ttk.Progressbar(recv_progress_frame, mode="determinate")
         self.recv_progress.pack(side=tk.LEFT, fill="x", expand=True)
-        self.recv_progress_percent_var = tk.StringVar(value="0%")
-        ttk.Label(recv_progress_frame, textvariable=self.recv_progress_percent_var, width=6).pack(side=tk.LEFT, padx=6)
+        # Plain labels updated via configure(text=...): these change only
+        # during a transfer, so a Tcl trace variable per label is overhead
+        self.recv_progress_percent_lbl = ttk.Label(recv_progress_frame, text="0%", width=6)
+        self.recv_progress_percent_lbl.pack(side=tk.LEFT, padx=6)
 
         recv_bytes_frame = ttk.Frame(right_frame)
         recv_bytes_frame.pack(fill="x", padx=5, pady=(0, 4))
-        self.recv_bytes_var = tk.StringVar(value="0 B / 0 B")
-        ttk.Label(recv_bytes_frame, textvariable=self.recv_bytes_var).pack(side=tk.LEFT)
-        self.recv_speed_var = tk.StringVar(value="Speed: -")
-        ttk.Label(recv_bytes_frame, textvariable=self.recv_speed_var).pack(side=tk.LEFT, padx=(10, 0))
-        self.recv_eta_var = tk.StringVar(value="ETA: -")
-        ttk.Label(recv_bytes_frame, textvariable=self.recv_eta_var).pack(side=tk.LEFT, padx=(10, 0))
+        self.recv_bytes_lbl = ttk.Label(recv_bytes_frame, text="0 B / 0 B")
+        self.recv_bytes_lbl.pack(side=tk.LEFT)
+        self.recv_speed_lbl = ttk.Label(recv_bytes_frame, text="Speed: -")
+        self.recv_speed_lbl.pack(side=tk.LEFT, padx=(10, 0))
+        self.recv_eta_lbl = ttk.Label(recv_bytes_frame, text="ETA: -")
+        self.recv_eta_lbl.pack(side=tk.LEFT, padx=(10, 0))
 
         # Recent files list
         recent_frame = ttk.LabelFrame(right_frame, text="Recently Received Files")
         recent_frame.pack(fill="both", expand=True, padx=0)
 
         self.recent_files_listbox = tk.Listbox(
-            recent_frame, height=6, font=("Arial", 9)
+            recent_frame, height=6, font="AppSmall"
         )
         recent_scrollbar = ttk.Scrollbar(recent_frame)
         self.recent_files_listbox.pack(
@@ -1824,8 +2486,30 @@ class FileTransferGUI:
         except Exception:
             pass
 
-        # Track recently received files as list of dicts {'path': fullpath, 'display': display}
-        self.recent_received_files = []
+        # Track recently received files as dicts {'path': fullpath, 'display': display};
+        # bounded ring, the listbox mirrors it in _add_recent_file
+        self.recent_received_files = deque(maxlen=20)
+
+        main_frame.pack_propagate(True)
+
+    def _on_tab_changed(self, event=None):
+        """Build lazily-constructed tabs the first time they are selected."""
+        try:
+            current = self.notebook.select()
+        except Exception:
+            return
+        if not self._about_built and current == str(self.about_frame):
+            self._about_built = True
+            try:
+                self._create_about_tab()
+            except Exception:
+                pass
+        elif not self._magi_built and current == str(self.magi_frame):
+            self._magi_built = True
+            try:
+                self._create_magi_tab()
+            except Exception:
+                pass
 
     def _create_magi_tab(self):
         """Create the MAGI System Console tab with boot sequence and dynamic data."""
@@ -1862,7 +2546,12 @@ class FileTransferGUI:
             # Check if tab already exists (don't add twice)
             if self.magi_frame.winfo_manager():
                 return
-            
+
+            # Build the console widget tree on first show (lazy)
+            if not self._magi_built:
+                self._magi_built = True
+                self._create_magi_tab()
+
             # Insert MAGI tab before About tab (before last tab)
             self.notebook.insert(2, self.magi_frame, text="⚡ MAGI Console")
             self.root.after(300, self._start_magi_boot_sequence)
@@ -1871,6 +2560,8 @@ class FileTransferGUI:
 
     def _hide_magi_tab(self):
         """Remove MAGI Console tab from notebook."""
+        # Stop any boot animation still in flight
+        self._magi_boot_cancelled = True
         try:
             # Find and remove MAGI tab by checking all tab IDs
             tabs = self.notebook.tabs()
@@ -1887,12 +2578,21 @@ class FileTransferGUI:
 
     def _write_magi_line(self, text, tag="system"):
         """Write a line to the MAGI console with specified tag."""
+        self._write_magi_lines([(text, tag)], scroll=True)
+
+    def _write_magi_lines(self, lines, scroll=False):
+        """Write several (text, tag) lines to the MAGI console in one pass.
+
+        One state toggle per batch, no forced update() (let Tk coalesce
+        paints), and see(END) only when the caller asks for it.
+        """
         try:
             self.magi_console.config(state="normal")
-            self.magi_console.insert(tk.END, text + "\n", tag)
-            self.magi_console.see(tk.END)
+            for text, tag in lines:
+                self.magi_console.insert(tk.END, text + "\n", tag)
             self.magi_console.config(state="disabled")
-            self.magi_console.update()
+            if scroll:
+                self.magi_console.see(tk.END)
         except Exception:
             pass
 
@@ -1904,63 +2604,51 @@ class FileTransferGUI:
             self.magi_console.delete("1.0", tk.END)
             self.magi_console.config(state="disabled")
 
-            # Get dynamic data once
-            connection = self._get_magi_connection_status()
-            latency = self._get_magi_latency()
-            packet_loss = self._get_magi_packet_loss()
-            bandwidth = self._get_magi_bandwidth()
-            
-            transfer_speed = self._get_magi_transfer_speed()
-            files_sent = self._get_magi_files_sent()
-            files_pending = self._get_magi_files_pending()
-            
-            cpu_load = self._get_magi_cpu_load()
-            memory_usage = self._get_magi_memory_usage()
-            device_status = self._get_magi_device_status()
-            
-            auth_status = self._get_magi_auth_status()
-            encryption = self._get_magi_encryption()
-
-            # Complete boot sequence + status in single animation
+            # Snapshot dynamic data once, then fill the pre-composed
+            # template (static lines are reused as-is, no per-run f-strings)
+            values = {
+                "connection": self._get_magi_connection_status(),
+                "latency": self._get_magi_latency(),
+                "packet_loss": self._get_magi_packet_loss(),
+                "bandwidth": self._get_magi_bandwidth(),
+                "transfer_speed": self._get_magi_transfer_speed(),
+                "files_sent": self._get_magi_files_sent(),
+                "files_pending": self._get_magi_files_pending(),
+                "cpu_load": self._get_magi_cpu_load(),
+                "memory_usage": self._get_magi_memory_usage(),
+                "device_status": self._get_magi_device_status(),
+                "auth_status": self._get_magi_auth_status(),
+                "encryption": self._get_magi_encryption(),
+            }
             boot_lines = [
-                ("", "system"),
-                ("[MAGI SYSTEM BOOT v1.0]", "header"),
-                (">>> INITIALIZING MODULES", "status"),
-                ("   Melchior ............. OK", "success"),
-                ("   Balthasar ............ OK", "success"),
-                ("   Casper ............... OK", "success"),
-                (">>> SYNCHRONIZATION .... COMPLETE", "status"),
-                (">>> TRINARY DECISION ENGINE ONLINE", "status"),
-                ("", "system"),
-                ("[CONNECTION STATUS]", "header"),
-                (f"CONNECTION: {connection}", "system"),
-                (f"LATENCY: {latency}", "system"),
-                (f"PACKET LOSS: {packet_loss}", "system"),
-                (f"BANDWIDTH: {bandwidth}", "system"),
-                ("", "system"),
-                ("[TRANSFER MODULE]", "header"),
-                (f"TRANSFER SPEED: {transfer_speed}", "system"),
-                (f"FILES SENT: {files_sent}", "system"),
-                (f"FILES PENDING: {files_pending}", "system"),
-                ("", "system"),
-                ("[DEVICE STATUS]", "header"),
-                (f"CPU LOAD: {cpu_load}", "system"),
-                (f"MEMORY USAGE: {memory_usage}", "system"),
-                (f"DEVICE STATUS: {device_status}", "system"),
-                ("", "system"),
-                ("[SECURITY CHECK]", "header"),
-                (f"AUTH STATUS: {auth_status}", "system"),
-                (f"ENCRYPTION: {encryption}", "system"),
-                ("", "system"),
-                (">>> MAGI SYSTEM READY", "status"),
+                (text if dyn is None else f"{dyn[0]}: {values[dyn[1]]}", tag)
+                for text, tag, dyn in _MAGI_BOOT_TEMPLATE
+            ]
+
+            # Animate via a single recurring timer walking an iterator of
+            # batches: only one Tk timer is pending at any moment (instead
+            # of pre-enqueuing every step), and hiding the tab cancels the
+            # remainder cleanly instead of writing into a detached widget.
+            batch_size = 4
+            batches = [
+                boot_lines[i:i + batch_size]
+                for i in range(0, len(boot_lines), batch_size)
             ]
+            it = iter(batches)
+            last = batches[-1] if batches else None
+            self._magi_boot_cancelled = False
 
-            # Write lines with animation (one-time, no loop)
-            for idx, (line, tag) in enumerate(boot_lines):
+            def step():
+                if self._magi_boot_cancelled:
+                    return
                 try:
-                    self.root.after(idx * 150, lambda l=line, t=tag: self._write_magi_line(l, t))
-                except Exception:
-                    pass
+                    batch = next(it)
+                except StopIteration:
+                    return
+                self._write_magi_lines(batch, scroll=batch is last)
+                self.root.after(600, step)
+
+            step()
         except Exception:
             pass
 
@@ -1977,24 +2665,21 @@ class FileTransferGUI:
     def _get_magi_latency(self):
         """Get simulated latency (ms)."""
         try:
-            import random
-            return f"{random.randint(1, 50)} ms"
+            return f"{_randint(1, 50)} ms"
         except Exception:
             return "N/A"
 
     def _get_magi_packet_loss(self):
         """Get simulated packet loss."""
         try:
-            import random
-            return f"{random.randint(0, 2)}%"
+            return f"{_randint(0, 2)}%"
         except Exception:
             return "N/A"
 
     def _get_magi_bandwidth(self):
         """Get simulated bandwidth usage."""
         try:
-            import random
-            return f"{random.randint(10, 95)} Mbps"
+            return f"{_randint(10, 95)} Mbps"
         except Exception:
             return "N/A"
 
@@ -2002,8 +2687,7 @@ class FileTransferGUI:
         """Get current transfer speed."""
         try:
             if self.server_running:
-                import random
-                return f"{random.randint(5, 50)} MB/s"
+                return f"{_randint(5, 50)} MB/s"
             return "0 MB/s"
         except Exception:
             return "N/A"
@@ -2019,24 +2703,21 @@ class FileTransferGUI:
     def _get_magi_files_pending(self):
         """Get simulated pending files."""
         try:
-            import random
-            return str(random.randint(0, 5))
+            return str(_randint(0, 5))
         except Exception:
             return "0"
 
     def _get_magi_cpu_load(self):
         """Get simulated CPU load."""
         try:
-            import random
-            return f"{random.randint(5, 45)}%"
+            return f"{_randint(5, 45)}%"
         except Exception:
             return "N/A"
 
     def _get_magi_memory_usage(self):
         """Get simulated memory usage."""
         try:
-            import random
-            return f"{random.randint(100, 500)} MB"
+            return f"{_randint(100, 500)} MB"
         except Exception:
             return "N/A"
 
@@ -2066,6 +2747,8 @@ class FileTransferGUI:
         # Main container with scrollbar
         main_container = ttk.Frame(self.about_frame)
         main_container.pack(fill="both", expand=True)
+        # Same construction-time layout freeze as _create_send_tab
+        main_container.pack_propagate(False)
 
         # Create canvas and scrollbar
         canvas = tk.Canvas(main_container, bg="#f0f0f0", highlightthickness=0)
@@ -2074,10 +2757,25 @@ class FileTransferGUI:
         )
         scrollable_frame = ttk.Frame(canvas)
 
-        # Configure the canvas
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scrollregion at most once per idle cycle:
+        # <Configure> fires for every child pack during construction and
+        # canvas.bbox("all") walks the whole widget tree each time
+        self._scrollregion_pending = False
+
+        def _flush_scrollregion():
+            self._scrollregion_pending = False
+            try:
+                canvas.configure(scrollregion=canvas.bbox("all"))
+            except Exception:
+                pass
+
+        def _schedule_scrollregion(event):
+            if self._scrollregion_pending:
+                return
+            self._scrollregion_pending = True
+            canvas.after_idle(_flush_scrollregion)
+
+        scrollable_frame.bind("<Configure>", _schedule_scrollregion)
 
         # Center the content
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -2137,6 +2835,9 @@ class FileTransferGUI:
                 foreground="#ff4444",
             )
             # do not pack now; shown only when NERV mode is active
+            # (if NERV mode was restored before this lazy build, show it)
+            if getattr(self, '_nerv_mode', False):
+                self.nerv_status_label.pack(pady=(4, 10))
         except Exception:
             self.nerv_status_label = None
 
@@ -2149,22 +2850,8 @@ class FileTransferGUI:
         features_frame = ttk.LabelFrame(content_container, text="Features")
         features_frame.pack(fill="x", pady=(0, 20), anchor="center")
 
-        features_text = """
-• Cross-platform compatibility (Windows, macOS, Linux)
-• No external dependencies - Pure Python
-• Automatic network discovery
-• Secure local file transfers
-• Real-time progress monitoring
-• User-friendly graphical interface
-• Support for large file transfers
-• Easy to use and setup
-• No installation required
-• Open source project
-• Regular updates and improvements
-• Community driven development
-"""
         features_label = ttk.Label(
-            features_frame, text=features_text, justify=tk.LEFT, font=("Arial", 9)
+            features_frame, text=_FEATURES_TEXT, justify=tk.LEFT, font="AppSmall"
         )
         features_label.pack(padx=10, pady=10, anchor=tk.W)
 
@@ -2172,23 +2859,8 @@ class FileTransferGUI:
         author_frame = ttk.LabelFrame(content_container, text="Developer Information")
         author_frame.pack(fill="x", pady=(0, 20), anchor="center")
 
-        author_text = """
-Developed by: Scorpionziky
-
-This application was created to provide a simple, reliable 
-file transfer solution for local networks without requiring 
-any additional software installations.
-
-The project aims to make file sharing between computers on 
-the same network as easy as possible, while maintaining 
-security and performance.
-
-If you encounter any issues or have suggestions for 
-improvements, please don't hesitate to contact me using 
-the methods below.
-"""
         author_label = ttk.Label(
-            author_frame, text=author_text, justify=tk.LEFT, font=("Arial", 9)
+            author_frame, text=_AUTHOR_TEXT, justify=tk.LEFT, font="AppSmall"
         )
         author_label.pack(padx=10, pady=10, anchor=tk.W)
 
@@ -2201,24 +2873,38 @@ the methods below.
         links_frame.pack(fill="x", pady=(0, 20), anchor="center")
 
         def _open_create_txt(md_name, txt_name):
-            base = Path(__file__).parent
-            md_path = base / md_name
-            txt_path = base / txt_name
-            # If .txt doesn't exist but .md does, create .txt from .md
+            md_path = _BASE_DIR / md_name
+            txt_path = _BASE_DIR / txt_name
+            # (Re)create the .txt from the .md only when missing or stale
             try:
-                if not txt_path.exists() and md_path.exists():
+                if md_path.exists():
                     try:
-                        with open(md_path, 'r', encoding='utf-8') as rf:
-                            content = rf.read()
-                        with open(txt_path, 'w', encoding='utf-8') as wf:
-                            wf.write(content)
+                        if (
+                            not txt_path.exists()
+                            or txt_path.stat().st_mtime < md_path.stat().st_mtime
+                        ):
+                            txt_path.write_text(
+                                md_path.read_text(encoding='utf-8'), encoding='utf-8'
+                            )
                     except Exception:
                         pass
                 # Prefer opening the .txt if exists, else open .md if exists
-                if txt_path.exists():
-                    webbrowser.open('file://' + str(txt_path))
-                elif md_path.exists():
-                    webbrowser.open('file://' + str(md_path))
+                target = txt_path if txt_path.exists() else md_path
+                if not target.exists():
+                    return
+                # Native opener (associated app) beats launching a browser
+                # for a local text file; webbrowser is the fallback
+                try:
+                    if sys.platform.startswith("win"):
+                        os.startfile(str(target))
+                    else:
+                        import subprocess
+
+                        opener = "open" if sys.platform == "darwin" else "xdg-open"
+                        subprocess.Popen([opener, str(target)])
+                except Exception:
+                    import webbrowser
+                    webbrowser.open('file://' + str(target))
             except Exception:
                 pass
 
@@ -2234,7 +2920,7 @@ the methods below.
         email_link = ttk.Label(
             email_frame,
             text="scorpionziky89@gmail.com",
-            font=("Arial", 9),
+            font="AppSmall",
             foreground="#3498db",
             cursor="hand2",
         )
@@ -2250,7 +2936,7 @@ the methods below.
         github_link = ttk.Label(
             github_frame,
             text="https://github.com/scorpionziky",
-            font=("Arial", 9),
+            font="AppSmall",
             foreground="#3498db",
             cursor="hand2",
         )
@@ -2261,18 +2947,18 @@ the methods below.
         tech_frame = ttk.LabelFrame(scrollable_frame, text="Technical Information")
         tech_frame.pack(fill="x", padx=20, pady=(0, 20), anchor="center")
 
-        tech_text = f"""
-Python Version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}
-Platform: {sys.platform}
-Hostname: {socket.gethostname()}
-Local IP: {self._get_local_ip()}
-Application Directory: {os.path.dirname(os.path.abspath(__file__))}
-"""
+        tech_text = _TECH_TEMPLATE.format(
+            py="{}.{}.{}".format(*sys.version_info[:3]),
+            plat=sys.platform,
+            host=self._hostname,
+            ip=self._get_local_ip(),
+            appdir=_BASE_DIR,
+        )
         tech_label = ttk.Label(
             tech_frame,
             text=tech_text,
             justify=tk.LEFT,
-            font=("Arial", 8),
+            font="AppTiny",
             foreground="#7f8c8d",
         )
         tech_label.pack(padx=10, pady=10, anchor=tk.W)
@@ -2281,23 +2967,11 @@ Application Directory: {os.path.dirname(os.path.abspath(__file__))}
         info_frame = ttk.LabelFrame(scrollable_frame, text="Additional Information")
         info_frame.pack(fill="x", padx=20, pady=(0, 20), anchor="center")
 
-        info_text = """
-This application is built using Python's standard library only, 
-making it lightweight and portable. It uses TCP sockets for 
-reliable file transfers and UDP multicast for service discovery.
-
-The application is designed for use on trusted local networks 
-only. For security reasons, it does not include encryption or 
-authentication features.
-
-If you enjoy using this application, consider starring the 
-project on GitHub or contributing to its development!
-"""
         info_label = ttk.Label(
             info_frame,
-            text=info_text,
+            text=_INFO_TEXT,
             justify=tk.LEFT,
-            font=("Arial", 8),
+            font="AppTiny",
             foreground="#7f8c8d",
         )
         info_label.pack(padx=10, pady=10, anchor=tk.W)
@@ -2306,91 +2980,155 @@ project on GitHub or contributing to its development!
         copyright_label = ttk.Label(
             scrollable_frame,
             text="© 2025 Scorpionziky All rights reserved.",
-            font=("Arial", 8),
+            font="AppTiny",
             foreground="#95a5a6",
         )
         copyright_label.pack(pady=(20, 30))
 
-        # Configure mouse wheel scrolling
+        # Configure mouse wheel scrolling. High-resolution wheels and
+        # trackpads deliver events far faster than redraws are useful;
+        # accumulate deltas and issue at most one yview_scroll per ~frame.
+        self._wheel_accum = 0
+        self._wheel_flush_pending = False
+
+        def _flush_wheel():
+            self._wheel_flush_pending = False
+            units, self._wheel_accum = self._wheel_accum, 0
+            if units:
+                try:
+                    canvas.yview_scroll(units, "units")
+                except Exception:
+                    pass
+
+        def _queue_scroll(units):
+            self._wheel_accum += units
+            if not self._wheel_flush_pending:
+                self._wheel_flush_pending = True
+                canvas.after(16, _flush_wheel)
+
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            _queue_scroll(int(-1 * (event.delta / 120)))
 
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
         # For Linux
-        def _on_scroll_up(event):
-            canvas.yview_scroll(-1, "units")
-
-        def _on_scroll_down(event):
-            canvas.yview_scroll(1, "units")
+        canvas.bind_all("<Button-4>", lambda e: _queue_scroll(-1))
+        canvas.bind_all("<Button-5>", lambda e: _queue_scroll(1))
 
-        canvas.bind_all("<Button-4>", _on_scroll_up)
-        canvas.bind_all("<Button-5>", _on_scroll_down)
+        main_container.pack_propagate(True)
 
     # -------------------------
     # Utilities: browse, log, etc.
     # -------------------------
     def _create_tooltip(self, widget, text):
-        """Create a tooltip for a widget."""
+        """Register a tooltip for a widget.
+
+        All tooltips share a single withdrawn Toplevel and Label; per
+        widget this stores only the text and two event bindings instead
+        of creating a window per widget.
+        """
+        self._tooltip_text[str(widget)] = text
+        widget.bind("<Enter>", self._show_tooltip)
+        widget.bind("<Leave>", self._hide_tooltip)
+
+    def _show_tooltip(self, event):
+        """Show the shared tooltip window next to the hovered widget."""
+        text = self._tooltip_text.get(str(event.widget))
+        if not text:
+            return
+        try:
+            if self._tooltip_win is None:
+                self._tooltip_win = tk.Toplevel(self.root)
+                self._tooltip_win.wm_overrideredirect(True)
+                self._tooltip_win.withdraw()
+                self._tooltip_label = ttk.Label(
+                    self._tooltip_win,
+                    text="",
+                    background="#ffffe0",
+                    relief=tk.SOLID,
+                    borderwidth=1,
+                )
+                self._tooltip_label.pack()
+            self._tooltip_label.config(text=text)
+            self._tooltip_win.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+            self._tooltip_win.deiconify()
+            self._tooltip_win.lift()
+        except Exception:
+            pass
+
+    def _hide_tooltip(self, event=None):
+        """Hide the shared tooltip window."""
+        try:
+            if self._tooltip_win is not None:
+                self._tooltip_win.withdraw()
+        except Exception:
+            pass
 
     # -------------------------
     # Easter-egg: NERV emergency and theme
     # -------------------------
-    def _on_beta_click(self):
-        """Handle clicks on the BETA label. 7 clicks toggles/activates NERV."""
-        try:
-            self._beta_click_count = getattr(self, '_beta_click_count', 0) + 1
-            # reset counter if too large
-            if self._beta_click_count > 7:
-                self._beta_click_count = 1
+    def _safe(self, fn, *args, **kwargs):
+        """Call fn swallowing any exception; returns None on failure.
 
-            if self._beta_click_count >= 7:
-                # Reset counter
-                self._beta_click_count = 0
-                # Toggle behavior: if already in nerv mode, deactivate; otherwise show emergency + activate
-                if getattr(self, '_nerv_mode', False):
-                    try:
-                        self._deactivate_nerv_mode()
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        # Show emergency modal and play NERV beep
-                        self._show_nerv_emergency_modal()
-                    except Exception:
-                        pass
-                    try:
-                        # Activate NERV theme after showing modal
-                        self._activate_nerv_mode()
-                    except Exception:
-                        pass
+        The NERV/easter-egg paths used to nest a try/except around every
+        call; routing them through one guarded dispatcher keeps the
+        bodies linear and the exception tables small.
+        """
+        try:
+            return fn(*args, **kwargs)
         except Exception:
-            pass
+            return None
+
+    def _on_beta_click(self):
+        """Handle clicks on the BETA label. 7 clicks toggles/activates NERV."""
+        self._beta_click_count = getattr(self, '_beta_click_count', 0) + 1
+        # reset counter if too large
+        if self._beta_click_count > 7:
+            self._beta_click_count = 1
+
+        if self._beta_click_count >= 7:
+            # Reset counter
+            self._beta_click_count = 0
+            # Toggle behavior: if already in nerv mode, deactivate; otherwise show emergency + activate
+            if getattr(self, '_nerv_mode', False):
+                self._safe(self._deactivate_nerv_mode)
+            else:
+                # Show emergency modal, then activate NERV theme
+                self._safe(self._show_nerv_emergency_modal)
+                self._safe(self._activate_nerv_mode)
 
     def _play_nerv_beep(self):
-        """Play a short sequence of beeps similar to the NERV alert (Windows fallback to bell)."""
+        """Play a short sequence of beeps similar to the NERV alert (Windows fallback to bell).
+
+        winsound.Beep blocks for its full duration, so the Windows
+        sequence (~640ms) runs on a short-lived daemon thread instead of
+        freezing the mainloop. Tk's bell() is not thread-safe, so the
+        non-Windows path stays on the UI thread and uses after() in
+        place of time.sleep for the second chime.
+        """
         try:
             if sys.platform.startswith("win"):
-                try:
-                    import winsound
-
-                    # A short sequence of two beeps
-                    winsound.Beep(750, 300)
-                    time.sleep(0.12)
-                    winsound.Beep(1000, 220)
-                except Exception:
+                def _worker():
                     try:
-                        self.root.bell()
-                        time.sleep(0.1)
-                        self.root.bell()
+                        import winsound
+
+                        # A short sequence of two beeps
+                        winsound.Beep(750, 300)
+                        time.sleep(0.12)
+                        winsound.Beep(1000, 220)
                     except Exception:
-                        pass
+                        try:
+                            self.root.after(0, self.root.bell)
+                            self.root.after(100, self.root.bell)
+                        except Exception:
+                            pass
+
+                threading.Thread(target=_worker, daemon=True).start()
             else:
                 try:
                     # Non-Windows: use bell twice
                     self.root.bell()
-                    time.sleep(0.12)
-                    self.root.bell()
+                    self.root.after(120, self.root.bell)
                 except Exception:
                     pass
         except Exception:
@@ -2398,166 +3136,122 @@ project on GitHub or contributing to its development!
 
     def _activate_nerv_mode(self):
         """Show NERV status text, reveal MAGI Console tab, and log activation."""
-        try:
-            if getattr(self, '_nerv_mode', False):
-                return
-            self._nerv_mode = True
+        if getattr(self, '_nerv_mode', False):
+            return
+        self._nerv_mode = True
 
-            # Show the small NERV confirmation under the header if present
-            try:
-                if getattr(self, 'nerv_status_label', None):
-                    try:
-                        self.nerv_status_label.pack(pady=(4, 10))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        # Show the small NERV confirmation under the header if present
+        if getattr(self, 'nerv_status_label', None):
+            self._safe(self.nerv_status_label.pack, pady=(4, 10))
 
-            # Show MAGI Console tab
-            try:
-                self._show_magi_tab()
-            except Exception:
-                pass
+        # Show MAGI Console tab
+        self._safe(self._show_magi_tab)
 
-            # Save NERV mode state to config
-            try:
-                self._write_config()
-            except Exception:
-                pass
+        # Save NERV mode state to config
+        self._safe(self._write_config)
 
-            # Log activation
-            try:
-                self._log_send("[EasterEgg] NERV Mode activated")
-            except Exception:
-                pass
-        except Exception:
-            pass
+        # Log activation
+        self._safe(self._log_send, "[EasterEgg] NERV Mode activated")
 
     def _deactivate_nerv_mode(self):
         """Hide NERV status text, hide MAGI Console tab, and log deactivation."""
-        try:
-            if not getattr(self, '_nerv_mode', False):
-                return
-            self._nerv_mode = False
-
-            try:
-                if getattr(self, 'nerv_status_label', None):
-                    try:
-                        self.nerv_status_label.pack_forget()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-
-            # Hide MAGI Console tab
-            try:
-                self._hide_magi_tab()
-            except Exception:
-                pass
+        if not getattr(self, '_nerv_mode', False):
+            return
+        self._nerv_mode = False
 
-            # Save NERV mode state to config
-            try:
-                self._write_config()
-            except Exception:
-                pass
+        if getattr(self, 'nerv_status_label', None):
+            self._safe(self.nerv_status_label.pack_forget)
 
-            try:
-                self._log_send("[EasterEgg] NERV Mode deactivated")
-            except Exception:
-                pass
+        # Hide MAGI Console tab
+        self._safe(self._hide_magi_tab)
 
-            try:
-                messagebox.showinfo("NERV Mode", "NERV Mode deactivated.")
-            except Exception:
-                pass
-        except Exception:
-            pass
+        # Save NERV mode state to config
+        self._safe(self._write_config)
 
-    def _restore_nerv_mode_on_startup(self):
-        """Restore NERV mode on startup if it was previously activated."""
-        try:
-            if getattr(self, '_nerv_mode', False):
-                # Show NERV label
-                try:
-                    if getattr(self, 'nerv_status_label', None):
-                        try:
-                            self.nerv_status_label.pack(pady=(4, 10))
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+        self._safe(self._log_send, "[EasterEgg] NERV Mode deactivated")
 
-                # Show MAGI Console tab
-                try:
-                    self._show_magi_tab()
-                except Exception:
-                    pass
+        self._safe(messagebox.showinfo, "NERV Mode", "NERV Mode deactivated.")
 
-                try:
-                    self._log_send("[EasterEgg] NERV Mode restored from config")
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    def _restore_nerv_mode_on_startup(self):
+        """Restore NERV mode on startup if it was previously activated."""
+        if not getattr(self, '_nerv_mode', False):
+            return
 
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(
-                tooltip, text=text, background="#ffffe0", relief=tk.SOLID, borderwidth=1
-            )
-            label.pack()
-            widget.tooltip = tooltip
+        # Show NERV label
+        if getattr(self, 'nerv_status_label', None):
+            self._safe(self.nerv_status_label.pack, pady=(4, 10))
 
-        def on_leave(event):
-            if hasattr(widget, "tooltip"):
-                widget.tooltip.destroy()
-                delattr(widget, "tooltip")
+        # Show MAGI Console tab
+        self._safe(self._show_magi_tab)
 
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        self._safe(self._log_send, "[EasterEgg] NERV Mode restored from config")
 
     def _clear_log(self, log_type: str):
         """Clear specified log."""
         if log_type == "send":
+            for bucket in self._log_buckets["send"].values():
+                bucket.clear()
+            self._send_log_pending.clear()
             self.send_log.config(state="normal")
             self.send_log.delete("1.0", tk.END)
             self.send_log.config(state="disabled")
         elif log_type == "recv":
+            for bucket in self._log_buckets["recv"].values():
+                bucket.clear()
+            self._recv_log_pending.clear()
             self.receive_log.config(state="normal")
             self.receive_log.delete("1.0", tk.END)
             self.receive_log.config(state="disabled")
 
     def _apply_log_filter(self, log_type: str):
-        """Apply filter to log display (currently placeholder; could be extended)."""
-        pass
+        """Re-render a log widget from the pre-bucketed entries for the selected level."""
+        try:
+            if log_type == "send":
+                widget, level = self.send_log, self.send_log_filter.get()
+                # buckets already hold these lines; drop the queued copies
+                self._send_log_pending.clear()
+            else:
+                widget, level = self.receive_log, self.recv_log_filter.get()
+                self._recv_log_pending.clear()
+            lines = self._log_buckets[log_type].get(level or "All")
+            widget.config(state="normal")
+            widget.delete("1.0", tk.END)
+            if lines:
+                # one bulk insert instead of one Tk call per line
+                widget.insert(tk.END, "".join(lines))
+            widget.config(state="disabled")
+            widget.see(tk.END)
+        except Exception:
+            pass
+
+    def _on_output_dir_changed(self, *args):
+        """Keep the cached output-dir string in sync with the StringVar."""
+        try:
+            self._output_dir_cached = self.output_dir_var.get()
+        except Exception:
+            pass
 
     def _add_recent_file(self, filename: str, filesize: int):
         """Add file to recently received files list."""
         try:
             size_str = self._format_file_size(filesize)
-            # If filename is an absolute path, show only basename in the list but
-            # keep the full path for selection. If it's relative, compute fullpath
-            # by joining with configured output directory.
-            try:
-                p = Path(filename)
-                if p.is_absolute():
-                    fullpath = str(p)
-                    display_name = os.path.basename(fullpath)
-                else:
-                    fullpath = os.path.join(self.output_dir_var.get(), filename)
-                    display_name = filename
-            except Exception:
-                fullpath = os.path.join(self.output_dir_var.get(), filename)
-                display_name = os.path.basename(fullpath)
+            # If filename is an absolute path, show only basename in the list
+            # but keep the full path for selection. If it's relative, join
+            # with the cached output directory — plain string ops only, this
+            # runs once per received file.
+            if os.path.isabs(filename):
+                fullpath = filename
+                display_name = os.path.basename(filename)
+            else:
+                fullpath = self._output_dir_cached + os.sep + filename
+                display_name = filename
 
             display = f"{display_name} ({size_str})"
 
-            # Keep only last 20 files
-            if len(self.recent_received_files) >= 20:
-                self.recent_files_listbox.delete(0, 0)
-                self.recent_received_files.pop(0)
+            # The deque drops the oldest entry automatically; trim the
+            # listbox head only when the ring actually rotates
+            if len(self.recent_received_files) == self.recent_received_files.maxlen:
+                self.recent_files_listbox.delete(0)
             self.recent_received_files.append({"path": fullpath, "display": display})
             self.recent_files_listbox.insert(tk.END, display)
             self.recent_files_listbox.see(tk.END)
@@ -2583,6 +3277,7 @@ project on GitHub or contributing to its development!
     def _open_email_client(self):
         """Open default email client"""
         try:
+            import webbrowser
             webbrowser.open("mailto:scorpionziky89@gmail.com")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open email client: {e}")
@@ -2590,6 +3285,7 @@ project on GitHub or contributing to its development!
     def _open_github(self):
         """Open GitHub page"""
         try:
+            import webbrowser
             webbrowser.open("https://github.com/scorpionziky")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open GitHub: {e}")
@@ -2599,7 +3295,12 @@ project on GitHub or contributing to its development!
 
         This addresses cases where dialogs are created too small and buttons at the bottom
         are not visible until user resizes the window.
+
+        Placement is done once per Toplevel: re-shown cached dialogs skip
+        the update_idletasks event flush and the screen-geometry queries.
         """
+        if getattr(dialog, '_ft_placed', False):
+            return
         try:
             dialog.update_idletasks()
             # requested size
@@ -2618,17 +3319,26 @@ project on GitHub or contributing to its development!
                 dialog.minsize(w, h)
             except Exception:
                 pass
+            dialog._ft_placed = True
         except Exception:
             pass
 
     def _refresh_discovery(self):
         """Force refresh of discovered machines list"""
         self._log_send("Scanning for machines...")
+        # Cancel any refresh already queued so rapid Scan clicks coalesce
+        # into a single machines-list rebuild
+        if self._pending_machine_update is not None:
+            try:
+                self.root.after_cancel(self._pending_machine_update)
+            except Exception:
+                pass
+            self._pending_machine_update = None
         if not self.discovery:
             # Start discovery service if missing
             self.start_discovery_service()
             # give it a short moment to populate
-            self.root.after(2000, self._update_machines_list)
+            self._pending_machine_update = self.root.after(2000, self._machine_update_fired)
             count = 0
         else:
             # If discovery already running, ask it to emit a beacon now
@@ -2638,11 +3348,39 @@ project on GitHub or contributing to its development!
             except Exception:
                 pass
             # schedule a UI update shortly to show new peers
-            self.root.after(1000, self._update_machines_list)
+            self._pending_machine_update = self.root.after(1000, self._machine_update_fired)
             count = len(self.discovery.get_peers())
 
         self._log_send(f"Scan complete. Found {count} machines.")
 
+    def _machine_update_fired(self):
+        """Run the deferred machines-list refresh and clear its handle."""
+        self._pending_machine_update = None
+        self._update_machines_list()
+
+    def _update_machines_list_throttled(self):
+        """Refresh the machines list at most once per 500ms.
+
+        The first call in a quiet period runs immediately; calls landing
+        inside the window set a pending flag and one trailing refresh
+        fires when the window closes, so discovery bursts collapse into
+        a couple of treeview updates without losing the final state.
+        """
+        now = time.monotonic()
+        gap = now - self._last_list_update
+        if gap >= 0.5:
+            self._last_list_update = now
+            self._update_machines_list()
+        elif not self._list_pending:
+            self._list_pending = True
+            self.root.after(int((0.5 - gap) * 1000) + 1, self._flush_list)
+
+    def _flush_list(self):
+        """Trailing-edge refresh scheduled by the throttle above."""
+        self._list_pending = False
+        self._last_list_update = time.monotonic()
+        self._update_machines_list()
+
     def _on_machine_select(self, event):
         """Handle machine selection from listbox"""
         sel = self.machines_tree.selection()
@@ -2656,10 +3394,8 @@ project on GitHub or contributing to its development!
             peers = self.discovery.get_peers()
             peer_info = peers.get(machine_name)
             if peer_info:
-                self.host_entry.delete(0, tk.END)
-                self.host_entry.insert(0, peer_info["ip"])
-                self.send_port_entry.delete(0, tk.END)
-                self.send_port_entry.insert(0, str(peer_info["port"]))
+                self.host_var.set(peer_info["ip"])
+                self.send_port_var.set(str(peer_info["port"]))
                 # Determine age and choose status color/icon
                 try:
                     now = time.time()
@@ -2674,46 +3410,31 @@ project on GitHub or contributing to its development!
                 if age is None:
                     color = "#3498db"
                 else:
-                    if age < 5:
-                        color = "#2ecc71"  # green
-                    elif age < 30:
-                        color = "#f1c40f"  # yellow
-                    else:
-                        color = "#95a5a6"  # gray
+                    color = _color_for_age(age)[0]
 
                 # Try to get a small colored image; fallback to emoji
                 status_img = self._get_status_image(color, size=14)
                 display_text = f"{machine_name}\n({peer_info['ip']}:{peer_info['port']})"
                 if status_img is not None:
                     self._selected_receiver_image = status_img
-                    try:
-                        # Use image on the left of the label
-                        self.selected_receiver_label.config(image=status_img, compound='left')
-                    except Exception:
-                        # fallback to text-only
-                        self.selected_receiver_label.config(image='')
                 else:
                     # Emoji fallback
-                    if color == "#2ecc71":
-                        status_icon = "\U0001F7E2"  # 🟢
-                    elif color == "#f1c40f":
-                        status_icon = "\U0001F7E1"  # 🟡
-                    elif color == "#95a5a6":
-                        status_icon = "\u26AA"     # ⚪
+                    if age is None:
+                        status_icon = "\u25CF"  # ●
                     else:
-                        status_icon = "\u25CF"     # ●
+                        status_icon = _color_for_age(age)[1]
                     display_text = f"{status_icon} {display_text}"
-                    try:
-                        self.selected_receiver_label.config(image='')
-                    except Exception:
-                        pass
 
-                # Update label text and color
-                self.selected_receiver_var.set(display_text)
+                # Two Tcl calls per selection: swap the image reference
+                # and set the text; compound and foreground are fixed at
+                # widget-build time
                 try:
-                    self.selected_receiver_label.config(foreground="darkgreen")
+                    self.selected_receiver_label.config(
+                        image=status_img if status_img is not None else ''
+                    )
                 except Exception:
                     pass
+                self.selected_receiver_var.set(display_text)
 
     def _update_machines_list(self):
         """Update the list of discovered machines"""
@@ -2723,39 +3444,41 @@ project on GitHub or contributing to its development!
         peers = self.discovery.get_peers()
         now = time.time()
 
-        # Rebuild treeview items
-        for iid in self.machines_tree.get_children():
-            self.machines_tree.delete(iid)
-        self._machines_order = []
-        self._item_to_name.clear()
-
-        for name in sorted(peers.keys()):
-            info = peers.get(name, {})
+        # Snapshot peer data as parallel arrays (SoA): the per-peer dict
+        # lookups and IP filtering happen in one pass here, and the
+        # formatting loop below runs on plain indexed lists
+        names, ips, ports, last_seens = [], [], [], []
+        for name, info in peers.items():
             ip = info.get("ip", "unknown")
-            port = info.get("port", "")
-            last_seen_ts = info.get("last_seen")
-
             # Apply IP filter if set
             if self.discovery_ip_filter and ip != "unknown":
                 if not ip.startswith(self.discovery_ip_filter):
                     continue  # Skip this peer if it doesn't match filter
+            names.append(name)
+            ips.append(ip)
+            ports.append(info.get("port", ""))
+            last_seens.append(info.get("last_seen"))
+        self._peer_names, self._peer_ips = names, ips
+        self._peer_ports, self._peer_last_seen = ports, last_seens
+
+        # Build the desired view state first (pure Python, no Tk calls)
+        desired = {}  # name -> (display_name, status_img or None)
+        for i in range(len(names)):
+            name, ip, port, last_seen_ts = names[i], ips[i], ports[i], last_seens[i]
 
             # Determine status indicator (use reliable Unicode codepoints to avoid mojibake)
             if last_seen_ts:
                 age = int(now - float(last_seen_ts))
-                if age < 5:
-                    status_icon = "\U0001F7E2"  # 🟢 Online
-                elif age < 30:
-                    status_icon = "\U0001F7E1"  # 🟡 Recently seen
-                else:
-                    status_icon = "\u26AA"     # ⚪ Offline/stale
+                color, status_icon = _color_for_age(age)
                 age_str = self._human_readable_age(age)
             else:
-                status_icon = "\u25CB"  # ○ unknown / just seen
+                status_icon = "\u25CB"  # unknown / just seen
+                color = "#3498db"  # blue for unknown
                 age_str = "now"
 
             # Always show a small status indicator (emoji) next to the name so the
-            # colored dot is visible in both simple and detailed modes.
+            # colored dot is visible in both simple and detailed modes. A small
+            # colored image (PIL required) is shown next to it when available.
             if getattr(self, "show_peer_details", False):
                 # Detailed view: include status icon, IP, port and last seen
                 display_name = f"{status_icon} {name} ({ip}:{port}) [{age_str}]"
@@ -2763,43 +3486,52 @@ project on GitHub or contributing to its development!
                 # Simple view (default): show status icon and machine name only
                 display_name = f"{status_icon} {name}"
 
-            # Insert into treeview. Prefer using a small colored image for the
-            # status dot (PIL required). If not available, prefix the name
-            # with a Unicode emoji as fallback.
-            # Determine color for status
-            if last_seen_ts:
-                if age < 5:
-                    color = "#2ecc71"  # green
-                elif age < 30:
-                    color = "#f1c40f"  # yellow
-                else:
-                    color = "#95a5a6"  # gray
-            else:
-                color = "#3498db"  # blue for unknown
+            desired[name] = (display_name, self._get_status_image(color))
 
-            status_img = self._get_status_image(color)
-            if status_img is not None:
-                # Use display_name so 'show_peer_details' is respected even when an image is shown
-                item = self.machines_tree.insert("", "end", text=display_name, image=status_img)
-                # keep reference to avoid GC
-                self._item_images[item] = status_img
-            else:
-                # fallback: include a colored emoji if images unavailable
-                # note: some platforms may render emoji monochrome
-                if color == "#2ecc71":
-                    status_icon = "\U0001F7E2"  # 🟢
-                elif color == "#f1c40f":
-                    status_icon = "\U0001F7E1"  # 🟡
-                elif color == "#95a5a6":
-                    status_icon = "\u26AA"     # ⚪
+        # Diff against what the Treeview already shows and touch only the
+        # rows that changed: O(delta) Tcl calls instead of a full
+        # delete-and-rebuild on every heartbeat. Selection survives because
+        # unchanged rows are never recreated.
+        for name in set(self._tree_items) - set(desired):
+            iid = self._tree_items.pop(name)
+            try:
+                self.machines_tree.delete(iid)
+            except Exception:
+                pass
+            self._item_images.pop(iid, None)
+            self._item_to_name.pop(iid, None)
+            self._tree_state.pop(name, None)
+
+        order = sorted(desired)
+        for index, name in enumerate(order):
+            display_name, status_img = desired[name]
+            iid = self._tree_items.get(name)
+            if iid is None:
+                # New peer: insert at its alphabetical position
+                if status_img is not None:
+                    iid = self.machines_tree.insert("", index, text=display_name, image=status_img)
+                    # keep reference to avoid GC
+                    self._item_images[iid] = status_img
                 else:
-                    status_icon = "\u25CF"     # ●
-
-                # Use the precomputed display_name (may include status icon and details)
-                item = self.machines_tree.insert("", "end", text=display_name)
+                    iid = self.machines_tree.insert("", index, text=display_name)
+                self._tree_items[name] = iid
+                self._item_to_name[iid] = name
+            elif self._tree_state.get(name) != desired[name]:
+                # Existing peer whose status text/dot changed: update in place
+                if status_img is not None:
+                    self.machines_tree.item(iid, text=display_name, image=status_img)
+                    self._item_images[iid] = status_img
+                else:
+                    self.machines_tree.item(iid, text=display_name)
+            self._tree_state[name] = desired[name]
+        self._machines_order = order
 
-            self._machines_order.append(name)
-            self._item_to_name[item] = name
+        # One layout pass for the whole refresh instead of leaving Tk to
+        # interleave idle redraws between row updates
+        try:
+            self.root.update_idletasks()
+        except Exception:
+            pass
 
         # Log if we're discovering anything
         if (
@@ -2836,49 +3568,54 @@ project on GitHub or contributing to its development!
     def _update_files_listbox(self):
         """Update the listbox with selected files"""
         self.files_listbox.delete(0, tk.END)
+        cache = self._file_display_cache
+        displays = []
         for filepath in self.selected_files:
-            path = Path(filepath)
-            if path.is_dir():
-                display_text = f"[FOLDER] {path.name}"
-            else:
-                size = path.stat().st_size
-                size_str = self._format_file_size(size)
-                display_text = f"{path.name} ({size_str})"
-            self.files_listbox.insert(tk.END, display_text)
+            display_text = cache.get(filepath)
+            if display_text is None:
+                # First time we see this path: one os.stat answers both
+                # the directory test and the size (is_dir + stat would
+                # hit the filesystem twice)
+                name = os.path.basename(filepath.rstrip("/\\")) or filepath
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    st = None
+                if st is not None and stat.S_ISDIR(st.st_mode):
+                    display_text = f"[FOLDER] {name}"
+                else:
+                    size = st.st_size if st is not None else 0
+                    size_str = self._format_file_size(size)
+                    display_text = f"{name} ({size_str})"
+                cache[filepath] = display_text
+            displays.append(display_text)
+        if displays:
+            # Variadic insert: one Tcl round-trip for the whole list
+            self.files_listbox.insert(tk.END, *displays)
 
     def _remove_selected_file(self):
         """Remove selected file from list"""
         selection = self.files_listbox.curselection()
         if selection:
             index = selection[0]
+            self._file_display_cache.pop(self.selected_files[index], None)
             del self.selected_files[index]
             self._update_files_listbox()
 
     def _clear_all_files(self):
         """Clear all selected files"""
         self.selected_files.clear()
+        self._file_display_cache.clear()
         self._update_files_listbox()
 
     def _format_file_size(self, size):
         """Format file size in human-readable format"""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return _format_size_cached(int(size))
 
     def _format_transfer_speed(self, bytes_per_sec: float) -> str:
         """Format transfer speed in a human-readable string (e.g., '1.2 MB/s')."""
         try:
-            bps = float(bytes_per_sec)
-            if bps <= 0:
-                return "-"
-            units = ["B/s", "KB/s", "MB/s", "GB/s"]
-            i = 0
-            while bps >= 1024 and i < len(units) - 1:
-                bps /= 1024.0
-                i += 1
-            return f"{bps:.2f} {units[i]}"
+            return _format_speed_cached(int(bytes_per_sec))
         except Exception:
             return "-"
 
@@ -2887,12 +3624,7 @@ project on GitHub or contributing to its development!
         try:
             if seconds is None:
                 return "-"
-            s = int(seconds)
-            if s < 60:
-                return f"{s}s"
-            m = s // 60
-            s = s % 60
-            return f"{m}m {s}s"
+            return _format_eta_cached(int(seconds))
         except Exception:
             return "-"
 
@@ -2943,12 +3675,15 @@ project on GitHub or contributing to its development!
             # event.data may be a Tcl list of file paths; use root.splitlist to parse
             items = self.root.splitlist(event.data)
             added = 0
+            # One set build keeps the duplicate check O(1) per path
+            existing = set(self.selected_files)
             for p in items:
                 # On Windows paths may come wrapped in { } if they contain spaces
                 if p.startswith("{") and p.endswith("}"):
                     p = p[1:-1]
-                if os.path.exists(p):
+                if p not in existing and os.path.exists(p):
                     self.selected_files.append(p)
+                    existing.add(p)
                     added += 1
             if added:
                 self._update_files_listbox()
@@ -2962,19 +3697,25 @@ project on GitHub or contributing to its development!
     def _paste_files_from_clipboard(self):
         """Fallback method to paste files from clipboard when DnD is unavailable."""
         try:
-            # Get clipboard content and parse file paths (Windows file paths are separated by \r\n)
+            # Get clipboard content and parse file paths with Tcl's list
+            # parser (same as drag-and-drop); it unwraps quoted and
+            # brace-wrapped entries in one C-level call
             clipboard_content = self.root.clipboard_get()
             if not clipboard_content:
                 return
-            paths = [p.strip() for p in clipboard_content.split('\n') if p.strip()]
+            try:
+                paths = self.root.splitlist(clipboard_content)
+            except tk.TclError:
+                paths = clipboard_content.splitlines()
             added = 0
+            # One set build keeps the duplicate check O(1) per path
+            existing = set(self.selected_files)
             for p in paths:
-                # Remove quotes if present (sometimes Windows puts paths in quotes)
-                p = p.strip('"')
-                if os.path.exists(p):
-                    if p not in self.selected_files:
-                        self.selected_files.append(p)
-                        added += 1
+                p = p.strip()
+                if p and p not in existing and os.path.exists(p):
+                    self.selected_files.append(p)
+                    existing.add(p)
+                    added += 1
             if added:
                 self._update_files_listbox()
                 self._log_send(f"Added {added} file(s)/folder(s) via clipboard paste (Ctrl+V)")
@@ -2986,35 +3727,100 @@ project on GitHub or contributing to its development!
             except Exception:
                 pass
 
-    def _log_send(self, message):
+    def _append_log(self, widget, line):
+        """Append one line to a log widget, trimming oldest lines past the cap."""
+        widget.config(state="normal")
+        widget.insert(tk.END, line)
+        try:
+            total = int(widget.index("end-1c").split(".")[0])
+            overflow = total - _LOG_MAX_LINES
+            if overflow > 0:
+                widget.delete("1.0", f"{overflow + 1}.0")
+        except Exception:
+            pass
+        widget.config(state="disabled")
+        # Coalesce autoscroll: one see(END) per idle cycle regardless of
+        # how many lines arrive in a burst
+        if widget not in self._autoscroll_pending:
+            self._autoscroll_pending.add(widget)
+            self.root.after_idle(self._do_autoscroll, widget)
+
+    def _do_autoscroll(self, widget):
+        """Scroll a log widget to the end (scheduled via after_idle)."""
+        self._autoscroll_pending.discard(widget)
+        try:
+            widget.see(tk.END)
+        except Exception:
+            pass
+
+    def _drain_log_widgets(self):
+        """Insert pending log lines into the Text widgets, one batch each.
+
+        Loggers only append to a list; this 100ms ticker performs the
+        single state-toggle/insert/trim round-trip per widget, so N rapid
+        lines cost one set of Tcl calls instead of N.
+        """
+        try:
+            drained = False
+            if self._send_log_pending:
+                lines, self._send_log_pending = self._send_log_pending, []
+                self._append_log(self.send_log, ''.join(lines))
+                drained = True
+            if self._recv_log_pending:
+                lines, self._recv_log_pending = self._recv_log_pending, []
+                self._append_log(self.receive_log, ''.join(lines))
+                drained = True
+            if drained:
+                # One layout pass per drain, never per line; update() would
+                # re-enter the event loop so only idle tasks are flushed
+                self.root.update_idletasks()
+        except Exception:
+            pass
+        self.root.after(100, self._drain_log_widgets)
+
+    def _log_send(self, message, level="INFO"):
         """Add message to send log and write to file. `level` default INFO."""
-        self.send_log.config(state="normal")
-        timestamp_local = time.strftime("%H:%M:%S")
-        iso_ts = time.strftime("%Y-%m-%dT%H:%M:%S")
-        self.send_log.insert(tk.END, f"[{timestamp_local}] {message}\n")
-        self.send_log.see(tk.END)
-        self.send_log.config(state="disabled")
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (
+                now,
+                time.strftime("%H:%M:%S"),
+                time.strftime("%Y-%m-%dT%H:%M:%S"),
+            )
+        _, timestamp_local, iso_ts = self._ts_cache
+        line = f"[{timestamp_local}] {message}\n"
+        buckets = self._log_buckets["send"]
+        buckets["All"].append(line)
+        buckets.get(level, buckets["INFO"]).append(line)
+        if self.send_log_filter.get() in ("All", level):
+            self._send_log_pending.append(line)
         self.status_bar.config(text=f"Send: {message}")
         # Write to log file with ISO timestamp and level
         try:
-            with open(self._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"[{iso_ts}] [INFO] [SEND] {message}\n")
+            self._log_write(f"[{iso_ts}] [{level}] [SEND] {message}\n")
         except Exception:
             pass
 
-    def _log_receive(self, message):
+    def _log_receive(self, message, level="INFO"):
         """Add message to receive log and write to file. `level` default INFO."""
-        self.receive_log.config(state="normal")
-        timestamp_local = time.strftime("%H:%M:%S")
-        iso_ts = time.strftime("%Y-%m-%dT%H:%M:%S")
-        self.receive_log.insert(tk.END, f"[{timestamp_local}] {message}\n")
-        self.receive_log.see(tk.END)
-        self.receive_log.config(state="disabled")
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (
+                now,
+                time.strftime("%H:%M:%S"),
+                time.strftime("%Y-%m-%dT%H:%M:%S"),
+            )
+        _, timestamp_local, iso_ts = self._ts_cache
+        line = f"[{timestamp_local}] {message}\n"
+        buckets = self._log_buckets["recv"]
+        buckets["All"].append(line)
+        buckets.get(level, buckets["INFO"]).append(line)
+        if self.recv_log_filter.get() in ("All", level):
+            self._recv_log_pending.append(line)
         self.status_bar.config(text=f"Receive: {message}")
         # Write to log file with ISO timestamp and level
         try:
-            with open(self._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"[{iso_ts}] [INFO] [RECV] {message}\n")
+            self._log_write(f"[{iso_ts}] [{level}] [RECV] {message}\n")
         except Exception:
             pass
 
@@ -3054,6 +3860,24 @@ project on GitHub or contributing to its development!
         status = "On" if self.compress_before_send else "Off"
         self.compress_status_var.set(f"Compression: {status}")
 
+    def _on_pref_var_changed(self, *args):
+        """Trace callback for the menu checkbutton vars.
+
+        Mirrors the vars into the plain attributes the transfer code reads
+        and persists the preference change right away.
+        """
+        try:
+            if getattr(self, 'notify_on_receive_var', None) is not None:
+                self.notify_on_receive = bool(self.notify_on_receive_var.get())
+            if getattr(self, 'compress_before_send_var', None) is not None:
+                self.compress_before_send = bool(self.compress_before_send_var.get())
+            # Snapshot on this (UI) thread; only the write leaves it
+            self._io_executor.submit(
+                self._write_config_data, self._config_snapshot()
+            )
+        except Exception:
+            pass
+
     def _apply_compress_var(self):
         """Apply the value from the compress BooleanVar (menu) to internal state and UI."""
         try:
@@ -3117,6 +3941,198 @@ project on GitHub or contributing to its development!
         thread.daemon = True
         thread.start()
 
+    def _iter_files(self, root):
+        """Yield a DirEntry for every regular file under root.
+
+        Iterative os.scandir walk: DirEntry carries the type (and on
+        some platforms the stat) from the readdir pass, so a deep tree
+        costs one syscall per directory instead of one per entry the
+        pathlib rglob way. Symlinked directories are not followed and
+        entries vanishing mid-walk are skipped.
+        """
+        stack = [str(root)]
+        while stack:
+            d = stack.pop()
+            try:
+                it = os.scandir(d)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+
+    def _walk_size(self, root):
+        """Total size of all regular files under root, via os.scandir."""
+        return sum(entry.stat().st_size for entry in self._iter_files(root))
+
+    def _compress_files_for_send(self, filepaths):
+        """Compress the selection to a temporary archive for sending.
+
+        Prefers a multi-threaded .tar.zst when the optional zstandard
+        module is installed; otherwise falls back to ZIP. The receiver
+        stores whichever file arrives, so the choice is sender-local.
+        """
+        if _zstd is not None:
+            try:
+                return self._compress_files_to_tar_zst(filepaths)
+            except Exception as e:
+                self._log_send(f"zstd compression failed, falling back to ZIP: {e}")
+        return self._compress_files_to_zip(filepaths)
+
+    def _compress_files_to_fileobj(self, filepaths, fileobj):
+        """Write the selection as an archive into a non-seekable fileobj.
+
+        tar.zst when zstandard is available, ZIP otherwise (zipfile
+        switches to data descriptors on unseekable output). Used by
+        _stream_compressed to feed a pipe, so no temp file is involved.
+        """
+        if _zstd is not None:
+            import tarfile
+
+            cctx = _zstd.ZstdCompressor(level=3, threads=-1)
+            with cctx.stream_writer(fileobj, closefd=False) as zfp:
+                with tarfile.open(fileobj=zfp, mode='w|') as tar:
+                    for filepath in filepaths:
+                        fpath = Path(filepath)
+                        tar.add(fpath, arcname=fpath.name)
+        else:
+            import zipfile
+
+            with zipfile.ZipFile(
+                fileobj, 'w', zipfile.ZIP_DEFLATED,
+                compresslevel=self.compress_level,
+            ) as zf:
+                for filepath in filepaths:
+                    fpath = Path(filepath)
+                    if fpath.is_file():
+                        zf.write(
+                            fpath, arcname=fpath.name,
+                            compress_type=zip_writer.pick_compress_type(fpath),
+                        )
+                    elif fpath.is_dir():
+                        parent = str(fpath.parent)
+                        for entry in self._iter_files(fpath):
+                            arcname = os.path.relpath(entry.path, parent)
+                            zf.write(
+                                entry.path,
+                                arcname=arcname.replace('\\', '/'),
+                                compress_type=zip_writer.pick_compress_type(entry.path),
+                            )
+
+    def _stream_compressed(self, client, filepaths, progress_callback=None):
+        """Compress the selection into a pipe while the client sends it.
+
+        Compression and network send overlap, so wall time is roughly
+        max(compress, send) instead of their sum and no temp archive
+        touches the disk. Returns (archive_name, bytes_sent). A failure
+        mid-stream can leave a truncated archive on the receiver; the
+        caller logs the error so the user knows to resend.
+        """
+        ext = '.tar.zst' if _zstd is not None else '.zip'
+        archive_name = f"ft_{int(time.time())}{ext}"
+
+        # The archive size is unknown while it is still being produced,
+        # so use the uncompressed input total as the progress reference:
+        # the bar advances conservatively (compressed bytes against the
+        # raw total) instead of sitting at 0% against a zero total
+        est_total = 0
+        for p in filepaths:
+            try:
+                if os.path.isdir(p):
+                    est_total += self._walk_size(p)
+                else:
+                    est_total += os.path.getsize(p)
+            except OSError:
+                pass
+
+        inner_callback = progress_callback
+        if inner_callback is not None and est_total > 0:
+            cap = est_total * 99 // 100
+
+            def progress_callback(sent, total, speed=None, eta=None):
+                # Hold at 99%: only the final ack proves completion
+                inner_callback(min(sent, cap), est_total, speed, eta)
+
+        r, w = os.pipe()
+        errors = []
+
+        def _producer():
+            wf = None
+            try:
+                wf = os.fdopen(w, 'wb')
+                with wf:
+                    self._compress_files_to_fileobj(filepaths, wf)
+            except Exception as e:
+                errors.append(e)
+                if wf is None:
+                    # fdopen itself failed, so nothing owns the raw fd
+                    # yet; close it here so the reader sees EOF. Once
+                    # wrapped, the with-block close is the only close —
+                    # a second os.close could hit a reused fd number.
+                    try:
+                        os.close(w)
+                    except OSError:
+                        pass
+
+        producer = threading.Thread(target=_producer, daemon=True)
+        producer.start()
+        try:
+            with os.fdopen(r, 'rb') as rf:
+                sent = client.send_stream(
+                    rf, archive_name, progress_callback=progress_callback
+                )
+        finally:
+            producer.join()
+        if errors:
+            raise errors[0]
+        if inner_callback is not None and est_total > 0:
+            try:
+                # Ack received: release the 99% cap and show completion
+                inner_callback(est_total, est_total, None, None)
+            except Exception:
+                pass
+        return archive_name, sent
+
+    def _compress_files_to_tar_zst(self, filepaths):
+        """
+        Compress files into a .tar.zst archive (requires zstandard).
+        Args:
+            filepaths: list of file paths to compress
+        Returns:
+            path to the created archive
+        """
+        import tarfile
+        import tempfile
+
+        fd, archive_path = tempfile.mkstemp(suffix='.tar.zst', prefix='ft_')
+        os.close(fd)
+        self._log_send(f"Compressing {len(filepaths)} file(s) to tar.zst...")
+
+        # threads=-1 lets zstd use every core for the heavy lifting
+        cctx = _zstd.ZstdCompressor(level=3, threads=-1)
+        with open(archive_path, 'wb') as raw:
+            with cctx.stream_writer(raw) as zfp:
+                with tarfile.open(fileobj=zfp, mode='w|') as tar:
+                    for filepath in filepaths:
+                        fpath = Path(filepath)
+                        if fpath.is_file():
+                            tar.add(fpath, arcname=fpath.name)
+                        elif fpath.is_dir():
+                            tar.add(
+                                fpath,
+                                arcname=str(fpath.relative_to(fpath.parent)),
+                            )
+
+        size = os.path.getsize(archive_path)
+        self._log_send(f"Compression complete: {self._format_file_size(size)}")
+        return archive_path
+
     def _compress_files_to_zip(self, filepaths):
         """
         Compress files into a ZIP archive.
@@ -3130,24 +4146,30 @@ project on GitHub or contributing to its development!
             # Create temporary ZIP file
             fd, zip_path = tempfile.mkstemp(suffix='.zip', prefix='ft_')
             os.close(fd)
-            
+
             zip_path = Path(zip_path)
             self._log_send(f"Compressing {len(filepaths)} file(s) to ZIP...")
-            
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for filepath in filepaths:
-                    fpath = Path(filepath)
-                    if fpath.is_file():
-                        # Add file to ZIP with relative name
-                        arcname = fpath.name
-                        zf.write(fpath, arcname=arcname)
-                    elif fpath.is_dir():
-                        # Recursively add directory contents
-                        for file_in_dir in fpath.rglob('*'):
-                            if file_in_dir.is_file():
-                                arcname = file_in_dir.relative_to(fpath.parent)
-                                zf.write(file_in_dir, arcname=str(arcname).replace('\\', '/'))
-            
+
+            # Resolve the member list up front: (source path, arcname)
+            members = []
+            total_input = 0
+            for filepath in filepaths:
+                fpath = Path(filepath)
+                if fpath.is_file():
+                    members.append((fpath, fpath.name))
+                    total_input += fpath.stat().st_size
+                elif fpath.is_dir():
+                    # Recursively add directory contents
+                    parent = str(fpath.parent)
+                    for entry in self._iter_files(fpath):
+                        arcname = os.path.relpath(entry.path, parent)
+                        members.append(
+                            (Path(entry.path), arcname.replace('\\', '/'))
+                        )
+                        total_input += entry.stat().st_size
+
+            self._write_zip(zip_path, members, total_input)
+
             zip_size = zip_path.stat().st_size
             self._log_send(f"Compression complete: {self._format_file_size(zip_size)}")
             return str(zip_path)
@@ -3155,17 +4177,111 @@ project on GitHub or contributing to its development!
             self._log_send(f"Compression failed: {e}")
             raise
 
+    def _write_zip(self, zip_path, members, total_input):
+        """Write (path, arcname) members to zip_path.
+
+        Uses the streaming writer from zip_writer (pluggable deflate
+        engine, tight chunk loop) whenever the classic ZIP format can
+        hold the payload; archives needing ZIP64 fall back to stdlib
+        zipfile, which handles the extended records.
+        """
+        use_stream = total_input < zip_writer.ZIP64_LIMIT and all(
+            m[0].stat().st_size < zip_writer.ZIP64_LIMIT for m in members
+        )
+        if use_stream:
+            # Fan member compression out across cores when the selection
+            # is multi-file and small enough to hold the compressed blobs
+            # in memory; members are written back in order, so the
+            # archive is identical to the serial result
+            if len(members) > 1 and total_input <= _PARALLEL_ZIP_MAX_BYTES:
+                try:
+                    return self._write_zip_parallel(zip_path, members, total_input)
+                except Exception:
+                    pass  # fall through to the serial streaming writer
+            with open(zip_path, 'wb') as fp:
+                self._preallocate(fp, total_input)
+                with zip_writer.ZipStreamWriter(fp, level=self.compress_level) as zw:
+                    for fpath, arcname in members:
+                        zw.add_file(
+                            fpath, arcname,
+                            compress_type=zip_writer.pick_compress_type(fpath),
+                        )
+                fp.flush()
+                os.ftruncate(fp.fileno(), fp.tell())
+        else:
+            import zipfile
+
+            with zipfile.ZipFile(
+                zip_path, 'w', zipfile.ZIP_DEFLATED,
+                compresslevel=self.compress_level,
+            ) as zf:
+                for fpath, arcname in members:
+                    zf.write(fpath, arcname=arcname)
+
+    def _write_zip_parallel(self, zip_path, members, total_input):
+        """Compress ZIP members on all cores, then concatenate in order.
+
+        DEFLATE members are self-contained, so each file is compressed
+        in a worker process (zip_writer.compress_member) and the main
+        thread only writes headers and pre-compressed blobs.
+        """
+        workers = min(os.cpu_count() or 1, len(members))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            blobs = pool.map(
+                zip_writer.compress_member,
+                [str(m[0]) for m in members],
+                [m[1] for m in members],
+                [self.compress_level] * len(members),
+            )
+            with open(zip_path, 'wb') as fp:
+                self._preallocate(fp, total_input)
+                with zip_writer.ZipStreamWriter(fp) as zw:
+                    for arcname, blob, crc, usize, mtime, mode, ctype in blobs:
+                        zw.add_precompressed(
+                            arcname, blob, crc, usize, mtime, mode,
+                            compress_type=ctype,
+                        )
+                fp.flush()
+                os.ftruncate(fp.fileno(), fp.tell())
+
+    @staticmethod
+    def _preallocate(fp, nbytes):
+        """Reserve nbytes of disk for fp where the OS supports it.
+
+        Pre-sizing to the uncompressed total lets the filesystem hand
+        out mostly-contiguous extents instead of growing the archive
+        write by write; callers ftruncate back to the real size once
+        the archive is finished. No-op on platforms (Windows) without
+        posix_fallocate or on filesystems that refuse it.
+        """
+        if nbytes > 0 and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fp.fileno(), 0, nbytes)
+            except OSError:
+                pass
+
     def _send_file_thread(self, host, port, filepaths):
         """Thread function to send file(s) with progress callback"""
         success = False
         send_start_time = time.time()
         total_size_sent = 0
         transferred_files = []  # Track files for history
+        tmp_zip_path = None  # Exact temp archive created this send, if any
         try:
             client = TransferClient(host, port, pause_event=self._pause_event, cancel_flag_fn=lambda: self._cancel_transfer)
             self._log_send(f"Connecting to {host}:{port}...")
 
             # Progress callback updates UI
+            # Progress throttle: the sender can deliver hundreds of
+            # callbacks per second at high throughput; values queued via
+            # _ui_set repaint at 10Hz anyway, so skip the formatting work
+            # for calls landing within 50ms of the last one (the final
+            # sent == total call always goes through)
+            last_ui_ns = [0]
+            # total is constant for the whole file, so format it once per
+            # file instead of on every accepted callback
+            last_total = [None, ""]
+
             def progress_callback(
                 sent,
                 total,
@@ -3176,45 +4292,39 @@ project on GitHub or contributing to its development!
                 total_eta=None,
                 filename=None,
             ):
+                now = time.monotonic_ns()
+                if now - last_ui_ns[0] < 50_000_000 and sent != total:
+                    return
+                last_ui_ns[0] = now
                 # Update per-file progress bar
                 try:
                     progress = (sent / total) * 100 if total else 0
                 except Exception:
                     progress = 0
-                self.root.after(0, lambda: self.send_progress.config(value=progress))
+                self._ui_set("send_progress", progress)
 
                 # Update percentage and bytes transferred
                 try:
-                    percent = int(progress)
-                    self.root.after(
-                        0, lambda: self.progress_percent_var.set(f"{percent}%")
-                    )
+                    self._ui_set("progress_percent_var", f"{int(progress)}%")
                     sent_str = self._format_file_size(sent)
-                    total_str = self._format_file_size(total)
-                    self.root.after(
-                        0,
-                        lambda: self.bytes_transferred_var.set(
-                            f"{sent_str} / {total_str}"
-                        ),
-                    )
+                    if total != last_total[0]:
+                        last_total[0] = total
+                        last_total[1] = self._format_file_size(total)
+                    self._ui_set("bytes_transferred_var", f"{sent_str} / {last_total[1]}")
                 except Exception:
                     pass
 
                 # Update speed and ETA labels
                 try:
                     if speed is not None:
-                        speed_str = self._format_transfer_speed(speed)
+                        # Quantized key keeps the formatter cache hot
+                        speed_str = self._format_transfer_speed(_quantize(int(speed)))
                         eta_file_str = self._format_eta(eta)
-                        self.root.after(
-                            0, lambda: self.speed_var.set(f"Speed: {speed_str}")
-                        )
-                        self.root.after(
-                            0,
-                            lambda: self.eta_file_var.set(f"ETA file: {eta_file_str}"),
-                        )
+                        self._ui_set("speed_var", f"Speed: {speed_str}")
+                        self._ui_set("eta_file_var", f"ETA file: {eta_file_str}")
                     else:
-                        self.root.after(0, lambda: self.speed_var.set("Speed: -"))
-                        self.root.after(0, lambda: self.eta_file_var.set("ETA file: -"))
+                        self._ui_set("speed_var", "Speed: -")
+                        self._ui_set("eta_file_var", "ETA file: -")
                 except Exception:
                     pass
 
@@ -3227,7 +4337,8 @@ project on GitHub or contributing to its development!
                 files_to_send = filepaths
                 if self.compress_before_send:
                     try:
-                        compressed_path = self._compress_files_to_zip(filepaths)
+                        compressed_path = self._compress_files_for_send(filepaths)
+                        tmp_zip_path = compressed_path
                         files_to_send = [compressed_path]
                         fname = Path(compressed_path).name
                     except Exception as e:
@@ -3316,16 +4427,15 @@ project on GitHub or contributing to its development!
                 if self.compress_before_send:
                     try:
                         self._log_send(f"Compressing directory: {Path(filepaths[0]).name}")
-                        compressed_path = self._compress_files_to_zip(filepaths)
-                        self._log_send("Sending compressed archive...")
-                        client.send_single_file(compressed_path, progress_callback=progress_callback)
+                        self._log_send("Streaming compressed archive...")
+                        # Compress into a pipe while sending: no temp
+                        # archive, and compression overlaps the upload
+                        archive_name, sent_bytes = self._stream_compressed(
+                            client, filepaths, progress_callback
+                        )
                         self.root.after(0, lambda: self._log_send("Directory sent successfully!"))
-                        # Track file for history
-                        try:
-                            total_size_sent += Path(compressed_path).stat().st_size
-                            transferred_files.append(Path(compressed_path).name)
-                        except Exception:
-                            pass
+                        total_size_sent += sent_bytes
+                        transferred_files.append(archive_name)
                     except Exception as e:
                         self._log_send(f"Warning: compression failed, sending uncompressed: {e}")
                         # Fallback: send directory uncompressed
@@ -3335,7 +4445,7 @@ project on GitHub or contributing to its development!
                         # Track directory for history
                         try:
                             dir_path = Path(filepaths[0])
-                            dir_size = sum(f.stat().st_size for f in dir_path.rglob('*') if f.is_file())
+                            dir_size = self._walk_size(dir_path)
                             total_size_sent += dir_size
                             transferred_files.append(dir_path.name)
                         except Exception:
@@ -3350,7 +4460,7 @@ project on GitHub or contributing to its development!
                     # Track directory for history
                     try:
                         dir_path = Path(filepaths[0])
-                        dir_size = sum(f.stat().st_size for f in dir_path.rglob('*') if f.is_file())
+                        dir_size = self._walk_size(dir_path)
                         total_size_sent += dir_size
                         transferred_files.append(dir_path.name)
                     except Exception:
@@ -3359,44 +4469,55 @@ project on GitHub or contributing to its development!
                 # Multiple files/folders
                 self._log_send(f"Sending {len(filepaths)} item(s)...")
                 
-                # Optional compression: if enabled, create ZIP
+                # Optional compression: if enabled, stream an archive
+                # through a pipe (compression overlaps the upload)
                 files_to_send = filepaths
                 if self.compress_before_send:
                     try:
-                        compressed_path = self._compress_files_to_zip(filepaths)
-                        files_to_send = [compressed_path]
-                        self._log_send("Sending compressed archive...")
+                        self._log_send("Streaming compressed archive...")
+                        archive_name, sent_bytes = self._stream_compressed(
+                            client, filepaths, progress_callback
+                        )
+                        self.root.after(
+                            0,
+                            lambda: self._log_send("Compressed archive sent successfully!"),
+                        )
+                        total_size_sent += sent_bytes
+                        transferred_files.append(archive_name)
+                        files_to_send = None  # archive already on the wire
                     except Exception as e:
                         self._log_send(f"Warning: compression failed, sending uncompressed: {e}")
                         files_to_send = filepaths
-                
-                # Expand directories to files
-                all_files = []
-                for filepath in files_to_send:
-                    if os.path.isdir(filepath):
-                        path = Path(filepath)
-                        all_files.extend(path.rglob("*"))
-                    else:
-                        all_files.append(Path(filepath))
 
-                files_only = [f for f in all_files if f.is_file()]
-                if files_only:
-                    client.send_multiple_files(
-                        files_only, progress_callback=progress_callback
-                    )
-                    self.root.after(
-                        0,
-                        lambda: self._log_send(
-                            f"All {len(files_only)} file(s) sent successfully!"
-                        ),
-                    )
-                    # Track files for history
-                    try:
-                        for fpath in files_only:
-                            total_size_sent += fpath.stat().st_size
-                            transferred_files.append(fpath.name)
-                    except Exception:
-                        pass
+                if files_to_send is not None:
+                    # Expand directories to files
+                    files_only = []
+                    for filepath in files_to_send:
+                        if os.path.isdir(filepath):
+                            files_only.extend(
+                                Path(entry.path)
+                                for entry in self._iter_files(filepath)
+                            )
+                        elif os.path.isfile(filepath):
+                            files_only.append(Path(filepath))
+
+                    if files_only:
+                        client.send_multiple_files(
+                            files_only, progress_callback=progress_callback
+                        )
+                        self.root.after(
+                            0,
+                            lambda: self._log_send(
+                                f"All {len(files_only)} file(s) sent successfully!"
+                            ),
+                        )
+                        # Track files for history
+                        try:
+                            for fpath in files_only:
+                                total_size_sent += fpath.stat().st_size
+                                transferred_files.append(fpath.name)
+                        except Exception:
+                            pass
 
             self.root.after(0, lambda: self.send_progress.config(value=100))
 
@@ -3420,21 +4541,16 @@ project on GitHub or contributing to its development!
                 self.root.after(0, lambda: self._log_send(f"Error: {error_msg}"))
                 self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
         finally:
-            # Clean up temporary ZIP files if compression was used
-            if self.compress_before_send:
+            # Remove exactly the temp archive this send created (globbing
+            # the temp dir raced with concurrent sends and scaled with
+            # however many stale files were lying around)
+            if tmp_zip_path:
                 try:
-                    import tempfile
-                    # Try to remove any temp files created during compression
-                    temp_dir = Path(tempfile.gettempdir())
-                    for zip_file in temp_dir.glob('ft_*.zip'):
-                        try:
-                            if zip_file.exists():
-                                zip_file.unlink()
-                        except Exception:
-                            pass
+                    Path(tmp_zip_path).unlink(missing_ok=True)
                 except Exception:
                     pass
-            
+
+
             self.root.after(0, lambda: self.send_btn.config(state="normal"))
             self.root.after(0, lambda: self.pause_btn.config(state="disabled"))
             self.root.after(0, lambda: self.cancel_btn.config(state="disabled"))
@@ -3457,7 +4573,7 @@ project on GitHub or contributing to its development!
             output_dir = os.path.abspath(output_dir)
         except Exception:
             pass
-        machine_name = self.machine_name_entry.get().strip() or socket.gethostname()
+        machine_name = self.machine_name_entry.get().strip() or self._hostname
 
         if not machine_name:
             messagebox.showerror("Error", "Please enter a machine name")
@@ -3495,10 +4611,10 @@ project on GitHub or contributing to its development!
             if self.discovery:
                 current_port = getattr(self.discovery, "port", None)
                 if current_port != port:
-                    self._start_discovery(socket.gethostname(), port)
+                    self._start_discovery(self._hostname, port)
             else:
                 # start discovery if somehow missing
-                self._start_discovery(socket.gethostname(), port)
+                self._start_discovery(self._hostname, port)
         except Exception as e:
             self._log_receive(f"Service discovery error: {e}")
 
@@ -3544,7 +4660,7 @@ project on GitHub or contributing to its development!
                 except Exception:
                     new_port = getattr(self.discovery, "port", 5000)
                 # restart discovery to broadcast selected port
-                self._start_discovery(socket.gethostname(), new_port)
+                self._start_discovery(self._hostname, new_port)
         except Exception:
             pass
         # Cancel connection monitor if running
@@ -3568,25 +4684,37 @@ project on GitHub or contributing to its development!
         """Run server in thread"""
         try:
             # Progress callback from server to update Receive tab UI
+            # Same 50ms throttle as the send-side callback: receive
+            # chunks arrive every 4 KB, far faster than the UI repaints
+            last_ui_ns = [0]
+            # total only changes between files; cache its formatted form
+            last_total = [None, ""]
+
             def _server_progress(sent, total, speed=None, eta=None, filename=None):
+                now = time.monotonic_ns()
+                if now - last_ui_ns[0] < 50_000_000 and sent != total:
+                    return
+                last_ui_ns[0] = now
                 try:
                     progress = (sent / total) * 100 if total else 0
                 except Exception:
                     progress = 0
                 try:
-                    # Update progress bar and text in the main thread
-                    self.root.after(0, lambda: self.recv_progress.config(value=progress))
-                    percent = int(progress)
-                    self.root.after(0, lambda: self.recv_progress_percent_var.set(f"{percent}%"))
+                    # Queue latest values; _flush_ui applies them on the main thread
+                    self._ui_set("recv_progress", progress)
+                    self._ui_set("recv_progress_percent_lbl", f"{int(progress)}%")
                     sent_str = self._format_file_size(sent)
-                    total_str = self._format_file_size(total)
-                    self.root.after(0, lambda: self.recv_bytes_var.set(f"{sent_str} / {total_str}"))
+                    if total != last_total[0]:
+                        last_total[0] = total
+                        last_total[1] = self._format_file_size(total)
+                    self._ui_set("recv_bytes_lbl", f"{sent_str} / {last_total[1]}")
                     if speed is not None:
-                        speed_str = self._format_transfer_speed(speed)
-                        self.root.after(0, lambda: self.recv_speed_var.set(f"Speed: {speed_str}"))
+                        # Quantized key keeps the formatter cache hot
+                        speed_str = self._format_transfer_speed(_quantize(int(speed)))
+                        self._ui_set("recv_speed_lbl", f"Speed: {speed_str}")
                     else:
-                        self.root.after(0, lambda: self.recv_speed_var.set("Speed: -"))
-                    self.root.after(0, lambda: self.recv_eta_var.set(f"ETA: {self._format_eta(eta)}"))
+                        self._ui_set("recv_speed_lbl", "Speed: -")
+                    self._ui_set("recv_eta_lbl", f"ETA: {self._format_eta(eta)}")
                 except Exception:
                     pass
 
@@ -3595,7 +4723,12 @@ project on GitHub or contributing to its development!
                 self._log_receive(f"Initializing TransferServer on port {port}, output_dir={output_dir}")
             except Exception:
                 pass
-            server = TransferServer(port=port, output_dir=output_dir, progress_callback=_server_progress)
+            server = TransferServer(
+                port=port,
+                output_dir=output_dir,
+                progress_callback=_server_progress,
+                socket_buffer=self.socket_buffer_kb * 1024,
+            )
             # Keep a reference to the running server so the GUI can update its
             # output directory while it's running (user may change Save folder).
             try:
@@ -3695,7 +4828,7 @@ project on GitHub or contributing to its development!
                             self.root.after(0, lambda: self._log_receive(f"Warning: Failed to record transfer history: {e}"))
                         
                         # after receiving, refresh discovery list (in case peers changed)
-                        self.root.after(0, self._update_machines_list)
+                        self.root.after(0, self._update_machines_list_throttled)
                         # Update tab badge
                         self.root.after(0, self._update_tab_badge)
                         return result
@@ -3769,6 +4902,7 @@ project on GitHub or contributing to its development!
     def _on_recent_double_click(self, event):
         """Open containing folder and select the recently received file."""
         try:
+            import subprocess
             sel = self.recent_files_listbox.curselection()
             if not sel:
                 return
@@ -3982,26 +5116,64 @@ project on GitHub or contributing to its development!
     # Network utils
     # -------------------------
     def _get_local_ip(self):
-        """Get local IP address"""
+        """Get local IP address (cached after the first successful lookup).
+
+        The UDP-connect trick can block for a while when no default route
+        exists, so the result is resolved once per session and reused;
+        `_refresh_local_ip` drops the cache when the network changes.
+        """
+        if self._local_ip_cache:
+            return self._local_ip_cache
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            return "127.0.0.1"
+            s.settimeout(0.5)
+            try:
+                s.connect(("8.8.8.8", 80))
+                ip = s.getsockname()[0]
+            finally:
+                s.close()
+        except Exception:
+            ip = "127.0.0.1"
+        self._local_ip_cache = ip
+        return ip
+
+    def _refresh_local_ip(self):
+        """Invalidate the cached local IP (e.g. after changing networks)."""
+        self._local_ip_cache = None
+        try:
+            self._log_send(f"Local IP refreshed: {self._get_local_ip()}")
+        except Exception:
+            pass
 
     # -------------------------
     # Config persistence
     # -------------------------
+    def _validated_socket_buffer(self, value):
+        """Clamp a socket-buffer preference (KB) to a sane range; 0 = OS default."""
+        try:
+            kb = int(value)
+        except (TypeError, ValueError):
+            return 0
+        if kb <= 0:
+            return 0
+        # 64 KB floor (below that tuning hurts), 16 MB ceiling
+        return min(max(kb, 64), 16384)
+
+    def _validated_compress_level(self, value):
+        """Clamp a DEFLATE level preference to zlib's 1-9 range."""
+        try:
+            level = int(value)
+        except (TypeError, ValueError):
+            return 1
+        return min(max(level, 1), 9)
+
     def _load_config(self):
         """Load GUI config (currently only 'broadcast_only')."""
         if not self._config_path.exists():
             return
         try:
-            with open(self._config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self._config_path, "rb") as f:
+                data = _json_loads(f.read())
             bo = data.get("broadcast_only")
             if isinstance(bo, bool):
                 try:
@@ -4043,8 +5215,7 @@ project on GitHub or contributing to its development!
                 rp = data.get("receive_port")
                 if rp is not None:
                     try:
-                        self.receive_port_entry.delete(0, tk.END)
-                        self.receive_port_entry.insert(0, str(rp))
+                        self.receive_port_var.set(str(rp))
                     except Exception:
                         pass
             except Exception:
@@ -4066,8 +5237,7 @@ project on GitHub or contributing to its development!
                 mn = data.get("machine_name")
                 if isinstance(mn, str) and mn:
                     try:
-                        self.machine_name_entry.delete(0, tk.END)
-                        self.machine_name_entry.insert(0, mn)
+                        self.machine_name_var.set(mn)
                     except Exception:
                         pass
             except Exception:
@@ -4091,6 +5261,22 @@ project on GitHub or contributing to its development!
             except Exception:
                 pass
 
+            # Socket buffer preference (KB)
+            try:
+                self.socket_buffer_kb = self._validated_socket_buffer(
+                    data.get("socket_buffer_kb")
+                )
+            except Exception:
+                self.socket_buffer_kb = 0
+
+            # Compression level preference
+            try:
+                self.compress_level = self._validated_compress_level(
+                    data.get("compress_level")
+                )
+            except Exception:
+                self.compress_level = 1
+
             # Notification preference (beep)
             try:
                 nb = data.get("notify_on_receive")
@@ -4106,9 +5292,19 @@ project on GitHub or contributing to its development!
         except Exception:
             pass
 
-    def _write_config(self):
-        """Write GUI config (currently only 'broadcast_only')."""
-        data = {"broadcast_only": bool(self.broadcast_only_var.get())}
+    def _config_snapshot(self):
+        """Collect all config values into a plain dict.
+
+        Reads every Tk variable/widget here, on the calling (UI) thread,
+        so the actual file write can run on the I/O executor without
+        cross-thread Tcl calls — those deadlock when the main loop is
+        blocked (exit path) and raise before mainloop() starts (traces
+        firing during _load_config).
+        """
+        try:
+            data = {"broadcast_only": bool(self.broadcast_only_var.get())}
+        except Exception:
+            data = {"broadcast_only": False}
         try:
             data["partial_cleanup_days"] = int(
                 getattr(self, "partial_cleanup_days", 30)
@@ -4140,7 +5336,7 @@ project on GitHub or contributing to its development!
         try:
             data["machine_name"] = self.machine_name_entry.get().strip()
         except Exception:
-            data["machine_name"] = socket.gethostname()
+            data["machine_name"] = self._hostname
         # Save NERV mode state
         try:
             data["nerv_mode"] = bool(getattr(self, "_nerv_mode", False))
@@ -4151,22 +5347,39 @@ project on GitHub or contributing to its development!
             data["compress_before_send"] = bool(getattr(self, "compress_before_send", False))
         except Exception:
             data["compress_before_send"] = False
+        # Save socket buffer preference
+        try:
+            data["socket_buffer_kb"] = int(getattr(self, "socket_buffer_kb", 0))
+        except Exception:
+            data["socket_buffer_kb"] = 0
+        # Save compression level preference
+        try:
+            data["compress_level"] = int(getattr(self, "compress_level", 1))
+        except Exception:
+            data["compress_level"] = 1
         # Save notification preference
         try:
             data["notify_on_receive"] = bool(getattr(self, "notify_on_receive", True))
         except Exception:
             data["notify_on_receive"] = True
+        return data
+
+    def _write_config_data(self, data):
+        """Serialize and write a config snapshot; safe off the UI thread."""
         try:
-            with open(self._config_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(self._config_path, "wb") as f:
+                f.write(_json_dumps(data, indent=True))
         except Exception as e:
             # Attempt to log the error to the GUI log file so user can diagnose
             try:
-                with open(self._log_file_path, 'a', encoding='utf-8') as lf:
-                    lf.write(f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] [ERROR] [CONFIG] Failed writing config: {e}\n")
+                self._log_write(f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] [ERROR] [CONFIG] Failed writing config: {e}\n")
             except Exception:
                 pass
 
+    def _write_config(self):
+        """Write GUI config synchronously (snapshot plus write, this thread)."""
+        self._write_config_data(self._config_snapshot())
+
     # -------------------------
     # Main / cleanup
     # -------------------------
@@ -4174,7 +5387,8 @@ project on GitHub or contributing to its development!
 
 def main():
     # Prefer the Tk wrapper from tkinterdnd2 if available so DnD works.
-    if TKDND_AVAILABLE and TkinterDnD:
+    dnd_files, TkinterDnD = _require_dnd()
+    if dnd_files and TkinterDnD:
         # Standard usage: TkinterDnD provides a Tk-compatible class
         try:
             root = TkinterDnD.Tk()
@@ -4187,7 +5401,7 @@ def main():
 
     def _on_closing_request():
         # If tray is available, hide to tray instead of exiting.
-        if TRAY_AVAILABLE:
+        if _require_tray():
             try:
                 app._hide_to_tray()
                 return
@@ -4219,4 +5433,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen Windows builds re-execute this exe for ProcessPoolExecutor
+    # spawn workers (parallel ZIP path); without this guard each worker
+    # would open another GUI instance and the parent pool would hang
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
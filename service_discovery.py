@@ -9,6 +9,11 @@ import json
 import time
 from typing import Dict, Optional, Callable
 
+# Precompiled mreq layouts for IP_ADD_MEMBERSHIP so the format string is
+# parsed once at import instead of on every group join.
+_MREQ_ANY = struct.Struct('4sl')     # (group, INADDR_ANY)
+_MREQ_IFACE = struct.Struct('4s4s')  # (group, local interface address)
+
 
 class ServiceDiscovery:
     MULTICAST_GROUP = '239.255.77.77'
@@ -112,6 +117,25 @@ class ServiceDiscovery:
                 }
             return result
                    
+    def get_multicast_status(self):
+        """Return (ok, error) describing the multicast listener state.
+
+        Inspects the live listen socket instead of binding a fresh probe
+        socket, so diagnostics can query multicast health while discovery
+        is running without contending for the multicast port.
+        """
+        if self.broadcast_only:
+            return False, 'broadcast-only mode (multicast disabled)'
+        sock = self._listen_sock
+        if sock is None:
+            return False, 'listener not running'
+        try:
+            if sock.fileno() < 0:
+                return False, 'listener socket closed'
+        except Exception as e:
+            return False, str(e)
+        return True, None
+
     def get_peer_ip(self, machine_name: str) -> Optional[str]:
         """Get IP address for a specific machine name"""
         with self.lock:
@@ -273,9 +297,9 @@ class ServiceDiscovery:
         try:
             if self.local_ip.startswith('127.') or self.local_ip == '0.0.0.0':
                 # Use INADDR_ANY membership
-                mreq = struct.pack('4sl', socket.inet_aton(self.MULTICAST_GROUP), socket.INADDR_ANY)
+                mreq = _MREQ_ANY.pack(socket.inet_aton(self.MULTICAST_GROUP), socket.INADDR_ANY)
             else:
-                mreq = struct.pack('4s4s', socket.inet_aton(self.MULTICAST_GROUP), socket.inet_aton(self.local_ip))
+                mreq = _MREQ_IFACE.pack(socket.inet_aton(self.MULTICAST_GROUP), socket.inet_aton(self.local_ip))
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
         except Exception:
             # Best-effort; if this fails we continue — broadcast fallback may still work.
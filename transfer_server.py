@@ -13,17 +13,27 @@ import hashlib
 class TransferServer:
     BUFFER_SIZE = 4096
     
-    def __init__(self, port=5000, output_dir='.', progress_callback=None):
+    def __init__(self, port=5000, output_dir='.', progress_callback=None, socket_buffer=0):
         self.port = port
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         # Optional callback to report progress: function(sent, total, speed=None, eta=None, filename=None)
         self.progress_callback = progress_callback
-        
+        # Requested SO_RCVBUF/SO_SNDBUF size in bytes (0 = OS default)
+        self.socket_buffer = socket_buffer
+
     def start(self):
         """Start the server and listen for incoming connections"""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if self.socket_buffer:
+                # Set on the listening socket so accepted connections
+                # inherit the sizes; the OS may round or cap the values
+                try:
+                    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer)
+                    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer)
+                except Exception:
+                    pass
             server_socket.bind(('0.0.0.0', self.port))
             server_socket.listen(1)
             
@@ -32,6 +42,13 @@ class TransferServer:
             while True:
                 try:
                     conn, addr = server_socket.accept()
+                    # Same tuning as the client side: no Nagle delay on
+                    # the small ack/offset replies, larger send buffer
+                    try:
+                        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+                    except Exception:
+                        pass
                     result = self._receive_files(conn)
                     # Do not return here; keep server running to accept further connections.
                 except Exception:
@@ -53,6 +70,8 @@ class TransferServer:
                 return self._receive_files_multi(conn)
             elif magic == 0xFFFF0003:
                 return self._receive_files_resumable_single(conn)
+            elif magic == 0xFFFF0004:
+                return self._receive_files_streamed(conn)
             else:
                 return None
                 
@@ -197,6 +216,75 @@ class TransferServer:
             print(f"\nError receiving resumable file: {e}")
             return None
 
+    def _receive_files_streamed(self, conn):
+        """Receive a byte stream of unknown total size.
+
+        Protocol (client -> server):
+        - filename_len (4 bytes !I)
+        - filename (utf-8)
+        - repeated records: chunk_len (4 bytes !I) + chunk bytes
+        A zero chunk_len ends the stream; server replies b'OK'.
+        The sender produces the data on the fly (e.g. compressing into a
+        pipe), so no total size or resume support is available.
+        """
+        try:
+            # Receive filename length
+            filename_len_data = self._recv_exact(conn, 4)
+            if not filename_len_data:
+                return None
+            filename_len = struct.unpack('!I', filename_len_data)[0]
+
+            # Receive filename
+            filename_data = self._recv_exact(conn, filename_len)
+            if not filename_data:
+                return None
+            filename = filename_data.decode('utf-8')
+
+            print(f"Receiving (streamed): {filename}")
+
+            output_path = self.output_dir / filename
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            received = 0
+            with open(output_path, 'wb') as f:
+                start_time = time.time()
+                while True:
+                    len_data = self._recv_exact(conn, 4)
+                    if not len_data:
+                        # Connection dropped before the terminator
+                        return None
+                    chunk_len = struct.unpack('!I', len_data)[0]
+                    if chunk_len == 0:
+                        break
+                    data = self._recv_exact(conn, chunk_len)
+                    if data is None:
+                        return None
+                    f.write(data)
+                    received += len(data)
+
+                    # Report progress via callback if available (total unknown)
+                    try:
+                        elapsed = time.time() - start_time
+                        speed = received / elapsed if elapsed > 0 else 0
+                        if self.progress_callback:
+                            try:
+                                self.progress_callback(received, 0, speed, None, filename)
+                            except Exception:
+                                pass
+                    except Exception:
+                        pass
+
+            print(f"File saved to: {output_path.absolute()}")
+
+            # Send acknowledgment
+            conn.sendall(b'OK')
+
+            return filename, received
+
+        except Exception as e:
+            print(f"\nError receiving streamed file: {e}")
+            return None
+
     def _receive_files_multi(self, conn):
         """Receive multiple files using multi-file protocol"""
         try:
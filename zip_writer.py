@@ -0,0 +1,329 @@
+"""
+ZIP Writer Module
+Minimal streaming ZIP creator with a pluggable raw-deflate engine.
+Stdlib zipfile routes every chunk through several Python layers; this
+writer keeps the per-chunk loop tight and lets a faster zlib-compatible
+engine (zlib-ng) take over transparently when installed, falling back
+to stdlib zlib otherwise. No ZIP64 support: callers must route archives
+with members or offsets at or above 4 GiB to stdlib zipfile.
+"""
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+try:
+    # zlib-ng ships a drop-in zlib API that is considerably faster on
+    # modern CPUs; optional, stdlib zlib is the baseline
+    from zlib_ng import zlib_ng as _engine
+except ImportError:
+    _engine = zlib
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+# Single-member size / archive offset ceiling for the classic ZIP format
+ZIP64_LIMIT = 0xFFFFFFFF
+
+CHUNK_SIZE = 1 << 20  # 1 MiB reads keep syscall count low
+
+# Files at or above this size are memory-mapped: the compressor then
+# reads straight from the page cache through memoryview slices instead
+# of copying into a userspace read buffer first. Below it the mmap
+# setup cost outweighs the saved copies.
+MMAP_THRESHOLD = 16 << 20
+
+_LFH = struct.Struct('<IHHHHHIIIHH')   # local file header
+_CDH = struct.Struct('<IHHHHHHIIIHHHHHII')  # central directory header
+_EOCD = struct.Struct('<IHHHHIIH')     # end of central directory
+
+
+# Leading-bytes signatures of formats that are already compressed;
+# deflating them burns CPU for essentially no size gain
+INCOMPRESSIBLE_MAGICS = (
+    b'PK\x03\x04',        # zip / docx / jar
+    b'\x1f\x8b',          # gzip
+    b'\xfd7zXZ\x00',      # xz
+    b'\x28\xb5\x2f\xfd',  # zstd
+    b'7z\xbc\xaf',        # 7z
+    b'\xff\xd8\xff',      # jpeg
+    b'\x89PNG',           # png
+    b'RIFF',              # webp / avi / wav containers
+    b'\x1a\x45\xdf\xa3',  # matroska / webm
+)
+
+# Below this size DEFLATE overhead dominates; store tiny members as-is
+MIN_COMPRESS_SIZE = 128
+
+
+def pick_compress_type(path, size=None):
+    """Return ZIP_STORED for already-compressed or tiny files.
+
+    Sniffs the first bytes against well-known compressed-container
+    magics; everything else gets ZIP_DEFLATED.
+    """
+    try:
+        if size is None:
+            size = os.path.getsize(path)
+        if size < MIN_COMPRESS_SIZE:
+            return ZIP_STORED
+        with open(path, 'rb') as f:
+            head = f.read(16)
+    except OSError:
+        return ZIP_DEFLATED
+    if head[4:8] == b'ftyp':  # mp4 / mov family keeps its magic at offset 4
+        return ZIP_STORED
+    for magic in INCOMPRESSIBLE_MAGICS:
+        if head.startswith(magic):
+            return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def compress_member(path, arcname, level=6):
+    """Compress one file to a raw-deflate blob plus header fields.
+
+    Module-level so ProcessPoolExecutor workers can pickle it; DEFLATE
+    members are independent, so files can be compressed on separate
+    cores and concatenated in order afterwards. Already-compressed
+    inputs (see pick_compress_type) are passed through stored.
+    Returns (arcname, blob, crc, orig_size, mtime, mode, compress_type).
+    """
+    st = os.stat(path)
+    compress_type = pick_compress_type(path, st.st_size)
+    comp = None
+    if compress_type == ZIP_DEFLATED:
+        comp = _engine.compressobj(level, zlib.DEFLATED, -15)
+    crc = 0
+    usize = 0
+    out = []
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            usize += len(chunk)
+            crc = zlib.crc32(chunk, crc)
+            out.append(comp.compress(chunk) if comp is not None else chunk)
+    if comp is not None:
+        out.append(comp.flush())
+    return arcname, b''.join(out), crc, usize, st.st_mtime, st.st_mode, compress_type
+
+
+def _dos_datetime(mtime):
+    """Convert a POSIX mtime to the (date, time) pair ZIP headers use."""
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, 0
+    dosdate = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    dostime = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    return dosdate, dostime
+
+
+class ZipStreamWriter:
+    """Write ZIP members sequentially to a seekable binary file object.
+
+    Each member's local header is written with placeholder CRC/size
+    fields which are patched in place once the data has streamed
+    through, so files are read exactly once and never buffered whole.
+    """
+
+    def __init__(self, fileobj, level=6):
+        self.fp = fileobj
+        self.level = level
+        self._central = []  # (name_bytes, flags, method, dt, dd, crc, csize, usize, ext_attr, offset)
+        # Pristine compressor kept as a clone template: copy() duplicates
+        # an initialised deflate state, skipping per-member parameter
+        # setup when an archive has many members
+        self._comp_template = None
+
+    def _new_compressor(self):
+        """Return a fresh raw-deflate compressor for one member."""
+        if self._comp_template is None:
+            self._comp_template = _engine.compressobj(self.level, zlib.DEFLATED, -15)
+        try:
+            return self._comp_template.copy()
+        except (AttributeError, ValueError):
+            # Engine without copy() support: fall back to a new object
+            return _engine.compressobj(self.level, zlib.DEFLATED, -15)
+
+    def add_file(self, path, arcname, compress_type=ZIP_DEFLATED):
+        """Stream one file into the archive under the given arcname."""
+        st = os.stat(path)
+        dosdate, dostime = _dos_datetime(st.st_mtime)
+        name_bytes = arcname.encode('utf-8')
+        flags = 0x800  # UTF-8 filename
+        offset = self.fp.tell()
+
+        # Placeholder header; CRC and sizes are patched after streaming
+        self.fp.write(_LFH.pack(
+            0x04034B50, 20, flags, compress_type,
+            dostime, dosdate, 0, 0, 0, len(name_bytes), 0,
+        ))
+        self.fp.write(name_bytes)
+
+        crc = 0
+        usize = 0
+        csize = 0
+        comp = None
+        if compress_type == ZIP_DEFLATED:
+            comp = self._new_compressor()
+        with open(path, 'rb') as f:
+            if st.st_size >= MMAP_THRESHOLD:
+                # Large file: map it and hand the compressor memoryview
+                # slices — data flows page cache -> zlib with no read()
+                # buffer in between
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as mv:
+                            # CRC runs on a side thread over the same
+                            # mapping: crc32 and compress both release
+                            # the GIL on large buffers, so the checksum
+                            # comes off the compression critical path
+                            size = len(mv)
+                            crc_out = [crc]
+
+                            def _crc_worker():
+                                c = crc_out[0]
+                                for off in range(0, size, CHUNK_SIZE):
+                                    with mv[off:off + CHUNK_SIZE] as piece:
+                                        c = zlib.crc32(piece, c)
+                                crc_out[0] = c
+
+                            crc_thread = threading.Thread(target=_crc_worker)
+                            crc_thread.start()
+                            try:
+                                for off in range(0, size, CHUNK_SIZE):
+                                    # Slices must be released before the
+                                    # map closes, hence the inner with
+                                    with mv[off:off + CHUNK_SIZE] as chunk:
+                                        usize += len(chunk)
+                                        out = comp.compress(chunk) if comp is not None else chunk
+                                        if out:
+                                            csize += len(out)
+                                            self.fp.write(out)
+                            finally:
+                                crc_thread.join()
+                            crc = crc_out[0]
+                except (ValueError, OSError):
+                    # mmap unavailable (empty file, odd fs): plain reads
+                    f.seek(0)
+                    crc, usize, csize = self._copy_chunks(f, comp, crc, usize, csize)
+            else:
+                crc, usize, csize = self._copy_chunks(f, comp, crc, usize, csize)
+        if comp is not None:
+            tail = comp.flush()
+            if tail:
+                csize += len(tail)
+                self.fp.write(tail)
+
+        # Patch CRC-32, compressed and uncompressed sizes in the header
+        end = self.fp.tell()
+        self.fp.seek(offset + 14)
+        self.fp.write(struct.pack('<III', crc, csize, usize))
+        self.fp.seek(end)
+
+        ext_attr = (st.st_mode & 0xFFFF) << 16
+        self._central.append((
+            name_bytes, flags, compress_type, dostime, dosdate,
+            crc, csize, usize, ext_attr, offset,
+        ))
+        return usize
+
+    def _copy_chunks(self, f, comp, crc, usize, csize):
+        """Pipelined read loop used when a file is too small to mmap.
+
+        A reader thread keeps up to two chunks queued ahead of the
+        crc/compress work: read() releases the GIL while blocked on
+        disk, so I/O overlaps compute instead of alternating with it.
+        Read errors propagate through the queue.
+        """
+        buf = queue.Queue(maxsize=2)
+
+        def _reader():
+            try:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    buf.put(chunk)
+                    if not chunk:
+                        break
+            except Exception as exc:
+                buf.put(exc)
+
+        reader = threading.Thread(target=_reader, daemon=True)
+        reader.start()
+        try:
+            while True:
+                chunk = buf.get()
+                if isinstance(chunk, Exception):
+                    raise chunk
+                if not chunk:
+                    break
+                usize += len(chunk)
+                crc = zlib.crc32(chunk, crc)
+                if comp is not None:
+                    chunk = comp.compress(chunk)
+                if chunk:
+                    csize += len(chunk)
+                    self.fp.write(chunk)
+        finally:
+            # Drain so the reader can't stay blocked on a full queue if
+            # the consumer loop bailed out early
+            while reader.is_alive():
+                try:
+                    buf.get_nowait()
+                except queue.Empty:
+                    pass
+                reader.join(0.01)
+        return crc, usize, csize
+
+    def add_precompressed(self, arcname, blob, crc, orig_size, mtime, mode,
+                          compress_type=ZIP_DEFLATED):
+        """Append a member whose data was already compressed elsewhere.
+
+        Sizes and CRC are known up front (e.g. from compress_member in a
+        worker process), so the header is written final with no patching.
+        """
+        dosdate, dostime = _dos_datetime(mtime)
+        name_bytes = arcname.encode('utf-8')
+        flags = 0x800  # UTF-8 filename
+        offset = self.fp.tell()
+        self.fp.write(_LFH.pack(
+            0x04034B50, 20, flags, compress_type,
+            dostime, dosdate, crc, len(blob), orig_size,
+            len(name_bytes), 0,
+        ))
+        self.fp.write(name_bytes)
+        self.fp.write(blob)
+        ext_attr = (mode & 0xFFFF) << 16
+        self._central.append((
+            name_bytes, flags, compress_type, dostime, dosdate,
+            crc, len(blob), orig_size, ext_attr, offset,
+        ))
+        return orig_size
+
+    def close(self):
+        """Write the central directory and end-of-central-directory."""
+        cd_offset = self.fp.tell()
+        for (name_bytes, flags, method, dostime, dosdate,
+             crc, csize, usize, ext_attr, offset) in self._central:
+            self.fp.write(_CDH.pack(
+                0x02014B50, (3 << 8) | 20, 20, flags, method,
+                dostime, dosdate, crc, csize, usize,
+                len(name_bytes), 0, 0, 0, 0, ext_attr, offset,
+            ))
+            self.fp.write(name_bytes)
+        cd_size = self.fp.tell() - cd_offset
+        count = len(self._central)
+        self.fp.write(_EOCD.pack(
+            0x06054B50, 0, 0, count, count, cd_size, cd_offset, 0,
+        ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()